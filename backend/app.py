@@ -47,8 +47,28 @@ except Exception as e:
     logger.error(f"Error details: {repr(e)}")
     chat_bp = None
 
-def create_app():
-    """Create and configure the Flask application"""
+try:
+    from routes.metrics_routes import metrics_bp
+    logger.info("✅ Successfully imported metrics_routes")
+except Exception as e:
+    logger.error(f"❌ Failed to import metrics_routes: {str(e)}")
+    metrics_bp = None
+
+from config import Config
+from services.cache_service import api_football_cache, RedisCacheService, TieredCacheService
+from services.warmup_service import warmup_service
+from services.live_data_poller import live_data_poller
+from services.http_client import http_client
+
+def create_app(start_background: bool = True):
+    """
+    Create and configure the Flask application
+
+    Args:
+        start_background: Restore the cache snapshot and start the warm-up and
+            live data threads; False for a process that will not serve
+            requests, such as the Werkzeug reloader's watcher
+    """
     # Get the project root directory
     project_root = Path(__file__).parent.parent
     
@@ -115,17 +135,56 @@ def create_app():
     else:
         logger.error("❌ Skipped chat routes (import failed)")
     
+    if metrics_bp:
+        app.register_blueprint(metrics_bp, url_prefix='/api/v1/metrics')
+        blueprints_registered.append('metrics')
+        logger.info("✅ Registered metrics routes")
+    else:
+        logger.error("❌ Skipped metrics routes (import failed)")
+    
     logger.info(f"📋 Total blueprints registered: {len(blueprints_registered)} - {blueprints_registered}")
     
-    # Health check endpoint
+    if start_background:
+        # Restore the per-worker memory cache from its last snapshot before warming it
+        if Config.CACHE_SNAPSHOT_PATH and not isinstance(api_football_cache, (RedisCacheService, TieredCacheService)):
+            api_football_cache.enable_snapshots(Config.CACHE_SNAPSHOT_PATH, Config.CACHE_SNAPSHOT_INTERVAL)
+        
+        # Prefetch the warm-up manifest in the background; readiness waits for it
+        warmup_service.start()
+        
+        # Keep current-season data cached so chat requests only read it
+        live_data_poller.start()
+    
+    # Health check endpoint: liveness and readiness together
     @app.route('/health')
     def health_check():
+        warmup = warmup_service.get_status()
         return jsonify({
             'status': 'healthy',
             'service': 'Blue\'s Book API',
-            'version': '1.0.0'
+            'version': '1.0.0',
+            'live': True,
+            'ready': warmup['ready'],
+            'warmup': warmup,
+            'live_data_poller': live_data_poller.get_status(),
+            'circuit_breakers': http_client.breakers.get_status()
         })
     
+    # Liveness probe: the process is up and serving requests
+    @app.route('/health/live')
+    def liveness_check():
+        return jsonify({'status': 'alive'})
+    
+    # Readiness probe: 503 until the cache is warm, so load balancers hold traffic back
+    @app.route('/health/ready')
+    def readiness_check():
+        warmup = warmup_service.get_status()
+        status_code = 200 if warmup['ready'] else 503
+        return jsonify({
+            'status': 'ready' if warmup['ready'] else 'warming',
+            'warmup': warmup
+        }), status_code
+    
     # API info endpoint
     @app.route('/api')
     def api_info():
@@ -137,7 +196,10 @@ def create_app():
                 'managers': '/api/v1/managers',
                 'search': '/api/v1/search',
                 'chat': '/api/v1/chat',
+                'metrics': '/api/v1/metrics',
                 'health': '/health',
+                'liveness': '/health/live',
+                'readiness': '/health/ready',
                 'debug': '/debug'
             }
         })
@@ -227,6 +289,7 @@ def create_app():
     return app
 
 if __name__ == '__main__':
-    app = create_app()
+    # Only the reloader's child (WERKZEUG_RUN_MAIN set) serves requests and starts the background threads
+    app = create_app(start_background=os.environ.get('WERKZEUG_RUN_MAIN') == 'true')
     app.run(debug=True, host='0.0.0.0', port=5001)
 
@@ -3,6 +3,7 @@ Configuration settings for Blue's Book application
 """
 
 import os
+import tempfile
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -17,6 +18,14 @@ class Config:
     API_FOOTBALL_KEY = os.getenv('API_FOOTBALL_KEY')
     API_FOOTBALL_URL = os.getenv('API_FOOTBALL_URL', 'https://api-football-v1.p.rapidapi.com/v3')
     
+    # RapidAPI plan limits shared by all API-Football clients; below the reserve they serve cache only
+    RAPIDAPI_DAILY_QUOTA = int(os.getenv('RAPIDAPI_DAILY_QUOTA', 100))
+    RAPIDAPI_QUOTA_RESERVE = int(os.getenv('RAPIDAPI_QUOTA_RESERVE', 10))
+    RAPIDAPI_RATE_PER_MINUTE = float(os.getenv('RAPIDAPI_RATE_PER_MINUTE', 30))
+    RAPIDAPI_BURST = int(os.getenv('RAPIDAPI_BURST', 10))
+    RAPIDAPI_MAX_WAIT = float(os.getenv('RAPIDAPI_MAX_WAIT', 5))  # seconds a request may wait for a token
+    RAPIDAPI_QUOTA_STATE_PATH = os.getenv('RAPIDAPI_QUOTA_STATE_PATH', os.path.join(tempfile.gettempdir(), 'bluesbook_rapidapi_quota.json'))
+    
     # Firebase Configuration
     FIREBASE_PROJECT_ID = os.getenv('FIREBASE_PROJECT_ID')
     FIREBASE_PRIVATE_KEY_ID = os.getenv('FIREBASE_PRIVATE_KEY_ID')
@@ -29,8 +38,50 @@ class Config:
     # Redis Configuration
     REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379')
     
+    # Cache backend: 'memory' (per worker), 'redis' (shared between workers)
+    # or 'tiered' (small per-worker L1 in front of shared Redis)
+    CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'memory')
+    CACHE_L1_MAX_ENTRIES = int(os.getenv('CACHE_L1_MAX_ENTRIES', 128))
+    CACHE_L1_TTL = int(os.getenv('CACHE_L1_TTL', 5))  # seconds an L1 copy is trusted
+    
+    # Upstream HTTP client: keep-alive pool sizes and GET retry policy
+    HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', 10))  # connections per host
+    HTTP_POOL_SIZES = os.getenv('HTTP_POOL_SIZES', 'api-football-v1.p.rapidapi.com=16,generativelanguage.googleapis.com=8')
+    HTTP_RETRIES = int(os.getenv('HTTP_RETRIES', 2))
+    HTTP_RETRY_BACKOFF = float(os.getenv('HTTP_RETRY_BACKOFF', 0.5))  # seconds, doubling per retry
+    HTTP_RETRY_STATUSES = os.getenv('HTTP_RETRY_STATUSES', '500,502,503,504')
+    CIRCUIT_BREAKER_ENABLED = os.getenv('CIRCUIT_BREAKER_ENABLED', 'true').lower() != 'false'
+    CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_FAILURE_THRESHOLD', 5))  # consecutive failures that open a host's circuit
+    CIRCUIT_RESET_TIMEOUT = float(os.getenv('CIRCUIT_RESET_TIMEOUT', 30))  # seconds open before a trial request
+    
     # Performance Settings
     CACHE_TTL = 86400  # 24 hours in seconds
+    CACHE_ENABLED = os.getenv('CACHE_ENABLED', 'true').lower() != 'false'
+    CACHE_MAX_ENTRIES = int(os.getenv('CACHE_MAX_ENTRIES', 512))
+    CACHE_MAX_BYTES = int(os.getenv('CACHE_MAX_BYTES', 32 * 1024 * 1024))  # 32 MB per worker
+    CACHE_SWEEP_INTERVAL = int(os.getenv('CACHE_SWEEP_INTERVAL', 60))  # seconds between expiry sweeps
+    CACHE_SNAPSHOT_PATH = os.getenv('CACHE_SNAPSHOT_PATH', '')  # empty disables; keep it in a directory only the app can write
+    CACHE_SNAPSHOT_INTERVAL = int(os.getenv('CACHE_SNAPSHOT_INTERVAL', 300))  # seconds between snapshots
+    CACHE_EARLY_REFRESH_BETA = float(os.getenv('CACHE_EARLY_REFRESH_BETA', 1.0))  # 0 disables early refresh
+    CACHE_COMPRESSION_THRESHOLD = int(os.getenv('CACHE_COMPRESSION_THRESHOLD', 16384))  # bytes; 0 disables
+    CACHE_COMPRESSION = os.getenv('CACHE_COMPRESSION', 'zlib')  # zlib or lz4 (needs the lz4 package)
+    
+    # Startup warm-up: workers report ready once the manifest's keys are cached
+    CACHE_WARMUP_ENABLED = os.getenv('CACHE_WARMUP_ENABLED', 'true').lower() != 'false'
+    CACHE_WARMUP_MANIFEST = os.getenv('CACHE_WARMUP_MANIFEST', os.path.join(os.path.dirname(__file__), 'warmup_manifest.json'))
+    CACHE_WARMUP_TIMEOUT = int(os.getenv('CACHE_WARMUP_TIMEOUT', 60))  # seconds before reporting ready regardless
+    
+    # Background poller keeping current-season data cached; lock is redis, file, none or auto
+    LIVE_POLLER_ENABLED = os.getenv('LIVE_POLLER_ENABLED', 'true').lower() != 'false'
+    LIVE_POLLER_INTERVAL = int(os.getenv('LIVE_POLLER_INTERVAL', 60))  # seconds between cycles
+    LIVE_POLLER_LOCK = os.getenv('LIVE_POLLER_LOCK', 'auto')
+    LIVE_POLLER_LOCK_PATH = os.getenv('LIVE_POLLER_LOCK_PATH', os.path.join(tempfile.gettempdir(), 'bluesbook_live_poller.lock'))
+    # During a Chelsea match the poller also polls the live fixture and writes score, status and events to the cache
+    LIVE_MATCH_ENABLED = os.getenv('LIVE_MATCH_ENABLED', 'true').lower() != 'false'
+    LIVE_MATCH_POLL_INTERVAL = float(os.getenv('LIVE_MATCH_POLL_INTERVAL', 5))  # seconds between live fixture polls
+    LIVE_MATCH_CACHE_TTL = int(os.getenv('LIVE_MATCH_CACHE_TTL', 900))  # seconds the final state stays readable
+    LIVE_MATCH_QUOTA_SHARE = float(os.getenv('LIVE_MATCH_QUOTA_SHARE', 0.5))  # of the RapidAPI quota left above the reserve
+    
     SEARCH_TIMEOUT = 0.3  # 300ms search timeout
     MAX_SEARCH_RESULTS = 10
     
@@ -5,6 +5,7 @@ This will be replaced with real API data later
 
 from datetime import datetime, date
 import random
+from services.cache_service import cached, local_data_cache
 
 # Sample Chelsea FC players data (2024/25 season)
 CHELSEA_PLAYERS = [
@@ -556,6 +557,7 @@ def get_managers_by_status(is_active=None):
     return [m for m in CHELSEA_MANAGERS_HISTORY if m["is_active"] == is_active]
 
 # Advanced statistics calculation functions
+@cached(ttl=3600, key="advanced_statistics", cache=local_data_cache)
 def calculate_advanced_statistics():
     """Calculate comprehensive squad statistics"""
     players = get_all_players()
@@ -185,6 +185,40 @@ def get_chat_context():
             'data': context_info
         })
         
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@chat_bp.route('/live-match', methods=['GET'])
+def get_live_match():
+    """Get the live Chelsea match from cache, optionally only deltas after ?since=<seq>"""
+    try:
+        # Through the services package, so this reads the cache the live match tracker writes
+        from services.football_api_service import FootballAPIService
+        
+        live_match = FootballAPIService().get_live_match()
+        if not live_match:
+            return jsonify({
+                'success': True,
+                'live': False,
+                'data': None
+            })
+        
+        since = request.args.get('since', type=int)
+        if since is not None:
+            live_match = {
+                **live_match,
+                'deltas': [delta for delta in live_match.get('deltas', []) if delta['seq'] > since]
+            }
+        
+        return jsonify({
+            'success': True,
+            'live': live_match.get('live', False),
+            'data': live_match
+        })
+        
     except Exception as e:
         return jsonify({
             'success': False,
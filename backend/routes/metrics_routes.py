@@ -0,0 +1,47 @@
+"""
+Metrics API routes for Blue's Book
+Exposes cache statistics used to tune TTLs and the RapidAPI quota
+"""
+
+from flask import Blueprint, jsonify, request
+
+# Import through the services package so this is the same cache the services use
+from services.cache_service import api_football_cache
+from services.rapidapi_quota import rapidapi_quota
+
+metrics_bp = Blueprint('metrics', __name__)
+
+@metrics_bp.route('/cache', methods=['GET'])
+def get_cache_metrics():
+    """Get hit/miss counters and sizes for the API-Football cache"""
+    try:
+        stats = api_football_cache.get_stats()
+        
+        if request.args.get('reset', '').lower() == 'true':
+            api_football_cache.reset_stats()
+        
+        return jsonify({
+            'success': True,
+            'data': stats
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@metrics_bp.route('/quota', methods=['GET'])
+def get_quota_metrics():
+    """Get remaining RapidAPI quota (from rate-limit headers) and limiter counters"""
+    try:
+        return jsonify({
+            'success': True,
+            'data': rapidapi_quota.get_status()
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
@@ -0,0 +1,268 @@
+"""
+Async API-Football Service for Blue's Book
+Lets async routes and background pollers run many concurrent fetches
+(multi-season backfills, several teams) without a thread per request
+"""
+
+import asyncio
+import time
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Callable, Tuple
+
+from config import Config
+
+try:
+    from .football_api_service import FootballAPIBase, FootballAPIService, COMPREHENSIVE_DEADLINE
+    from .cache_service import caching_enabled
+    from .rapidapi_quota import rapidapi_quota
+    from .http_client import http_client
+except ImportError:
+    from services.football_api_service import FootballAPIBase, FootballAPIService, COMPREHENSIVE_DEADLINE
+    from services.cache_service import caching_enabled
+    from services.rapidapi_quota import rapidapi_quota
+    from services.http_client import http_client
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFootballAPIService(FootballAPIBase):
+    """
+    Async counterpart of FootballAPIService built on httpx
+
+    Sections are read from and written to the same cache entries as the sync
+    client (cache-aside; single-flight and stale serving stay with the sync
+    client). Request building and response formatting come from
+    FootballAPIBase, so both clients return identical sections.
+    """
+
+    def __init__(self, team_id: Optional[int] = None, season: Optional[int] = None,
+                 client: Optional[Any] = None, max_concurrency: int = 50):
+        """
+        Initialize async API-Football client
+
+        Args:
+            team_id: Team to fetch (defaults to Chelsea)
+            season: Season to fetch (defaults to the current season)
+            client: httpx.AsyncClient to use; one with pooled keep-alive connections is created if omitted
+            max_concurrency: Most requests this client (and its scoped copies) keeps in flight
+        """
+        super().__init__(team_id=team_id, season=season)
+        if client is None and httpx is None:
+            raise RuntimeError("httpx package is not installed")
+        self._client = client
+        self._owns_client = client is None
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    def for_scope(self, team_id: Optional[int] = None, season: Optional[int] = None) -> 'AsyncFootballAPIService':
+        """A client for another team or season sharing this one's connections and concurrency limit"""
+        scoped = AsyncFootballAPIService(
+            team_id=team_id or self.chelsea_team_id,
+            season=season or self.current_season,
+            client=self._get_client(),
+            max_concurrency=self.max_concurrency
+        )
+        scoped._semaphore = self._semaphore
+        scoped._owns_client = False
+        return scoped
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if this service created it"""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> 'AsyncFootballAPIService':
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def get_current_season_stats(self) -> Dict[str, Any]:
+        """Get the team's season statistics"""
+        return await self._cached_section(FootballAPIService.get_current_season_stats, (), 'season_stats')
+
+    async def get_recent_matches(self, limit: int = 5) -> Dict[str, Any]:
+        """Get the team's recent match results"""
+        return await self._cached_section(FootballAPIService.get_recent_matches, (limit,), 'recent_matches', limit)
+
+    async def get_next_matches(self, limit: int = 3) -> Dict[str, Any]:
+        """Get the team's upcoming fixtures"""
+        return await self._cached_section(FootballAPIService.get_next_matches, (limit,), 'next_matches', limit)
+
+    async def get_league_standings(self) -> Dict[str, Any]:
+        """Get the league table with the team's position"""
+        return await self._cached_section(FootballAPIService.get_league_standings, (), 'standings')
+
+    async def get_current_squad_stats(self) -> Dict[str, Any]:
+        """Get the squad with this season's player statistics"""
+        return await self._cached_section(FootballAPIService.get_current_squad_stats, (), 'squad_stats')
+
+    async def get_comprehensive_current_data(self, deadline: Optional[float] = None) -> Dict[str, Any]:
+        """Get all current data concurrently, returning what arrived within the deadline"""
+        if not self.is_available():
+            return {
+                "available": False,
+                "error": "API-Football service not available - API key not configured",
+                "note": "Using historical data only"
+            }
+
+        sections, section_timings = await self._gather_sections({
+            "current_season": self.get_current_season_stats(),
+            "recent_matches": self.get_recent_matches(3),
+            "upcoming_fixtures": self.get_next_matches(2),
+            "league_position": self.get_league_standings()
+        }, COMPREHENSIVE_DEADLINE if deadline is None else deadline)
+
+        return {
+            "available": True,
+            **sections,
+            "data_staleness": self._summarize_staleness(sections),
+            "section_timings": section_timings,
+            "data_timestamp": datetime.now().isoformat()
+        }
+
+    async def backfill_season_stats(self, seasons: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Fetch season statistics for several seasons concurrently"""
+        results = await asyncio.gather(
+            *(self.for_scope(season=season).get_current_season_stats() for season in seasons)
+        )
+        return dict(zip(seasons, results))
+
+    def _get_client(self) -> Any:
+        """The pooled HTTP client, created on first use"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=10,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=Config.HTTP_POOL_SIZE
+                ),
+                # httpx retries connection failures only, never a request that was sent
+                transport=httpx.AsyncHTTPTransport(retries=Config.HTTP_RETRIES)
+            )
+        return self._client
+
+    async def _cached_section(self, getter: Callable, args: tuple, section: str,
+                              limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Serve a section from the shared cache, fetching and caching it on a miss
+
+        Fresh entries, and failures still backing off, are served as the sync
+        getters would serve them. A failed fetch (circuit open, quota refused,
+        upstream error) is negative-cached, so the last good value is served
+        marked degraded.
+
+        Cache calls block on Redis with a shared backend (the TTL policy too,
+        through the fixture calendar), so they run in worker threads.
+        """
+        settings = await asyncio.to_thread(getter.cache_settings, self, *args)
+        cache = settings['cache']
+        annotate = settings['annotate']
+
+        if caching_enabled():
+            cached_section = await asyncio.to_thread(cache.peek_with_info, settings['key'])
+            if cached_section is not None:
+                value, info = cached_section
+                if not info['stale'] or info.get('retry_in_seconds', 0) > 0:
+                    return annotate(value, info)
+
+        # Read before fetching, so a tag invalidated during the fetch still drops this result
+        tag_versions = await asyncio.to_thread(cache.tag_versions, settings['tags']) if caching_enabled() else None
+        result = await self._fetch_section(section, limit)
+        if not caching_enabled():
+            return result
+
+        if settings['cache_if'](result):
+            await asyncio.to_thread(
+                cache.set, settings['key'], result, settings['ttl'], settings['stale_ttl'], settings['tags'],
+                tag_versions=tag_versions
+            )
+            return result
+        value, info = await asyncio.to_thread(
+            cache.set_failure, settings['key'], result, settings['negative_ttl'], settings['max_negative_ttl'],
+            settings['tags'], tag_versions=tag_versions
+        )
+        return annotate(value, info)
+
+    async def _fetch_section(self, section: str, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Fetch and format one section from API-Football
+
+        The RapidAPI quota lives in a locked state file and parsing may touch
+        the shared cache, so both run in worker threads off the event loop.
+        """
+        if not self.is_available():
+            return {"error": "API-Football service not available", "available": False}
+
+        request = self._section_request(section, limit)
+        # Same per-host breaker as the sync client, so both stop calling a failing API-Football
+        breakers = http_client.breakers
+        # Claim the request (or half-open trial) before spending quota on it
+        if not breakers.allow_request(self.base_url):
+            return self._circuit_open_error()
+
+        try:
+            delay = await asyncio.to_thread(rapidapi_quota.reserve)
+            if delay is None:
+                breakers.for_url(self.base_url).release()
+                return self._quota_refusal()
+
+            headers, validator = self._conditional_headers(request)
+            await asyncio.sleep(delay)
+            async with self._semaphore:
+                response = await self._get_client().get(
+                    f"{self.base_url}/{request['endpoint']}", headers=headers, params=request['params']
+                )
+        except asyncio.CancelledError:
+            # Cut off by the section deadline: no outcome to record, but the trial must not stay claimed
+            breakers.for_url(self.base_url).release()
+            raise
+        except Exception as e:
+            breakers.for_url(self.base_url).record_failure()
+            logger.error(f"API-Football request error: {str(e)}")
+            return {"error": f"Request failed: {str(e)}", "available": False}
+
+        if response.status_code >= 500:
+            breakers.for_url(self.base_url).record_failure()
+        else:
+            breakers.for_url(self.base_url).record_success()
+        await asyncio.to_thread(rapidapi_quota.record, response.status_code, response.headers)
+        return await asyncio.to_thread(
+            self._parse_response, request, validator, response.status_code, response.headers, response.content
+        )
+
+    @staticmethod
+    async def _gather_sections(coroutines: Dict[str, Any],
+                               deadline: float) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """Run section coroutines concurrently, cancelling those still running at the deadline"""
+        started = time.time()
+
+        async def timed(coroutine: Any) -> Tuple[Dict[str, Any], float]:
+            fetch_started = time.time()
+            result = await coroutine
+            return result, round(time.time() - fetch_started, 3)
+
+        tasks = {name: asyncio.ensure_future(timed(coroutine)) for name, coroutine in coroutines.items()}
+        await asyncio.wait(tasks.values(), timeout=deadline)
+
+        sections = {}
+        section_timings = {}
+        for name, task in tasks.items():
+            if not task.done():
+                task.cancel()
+                logger.warning(f"API-Football section {name} missed the {deadline}s deadline")
+                sections[name] = {"error": f"Timed out after {deadline}s", "available": False, "timed_out": True}
+                section_timings[name] = {"duration_seconds": round(time.time() - started, 3), "timed_out": True}
+                continue
+
+            sections[name], duration = task.result()
+            section_timings[name] = {"duration_seconds": duration, "timed_out": False}
+
+        return sections, section_timings
@@ -3,102 +3,1514 @@ Simple in-memory cache service for API-Football responses
 Reduces API calls and improves response times
 """
 
+import atexit
+import functools
+import heapq
+import inspect
+import itertools
+import math
+import os
+import pickle
+import random
+import sqlite3
+import sys
+import threading
 import time
-from typing import Dict, Any, Optional
+import uuid
+import zlib
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Callable, Tuple, List, Iterator, Iterable, Union
 import logging
+from config import Config
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
 
 logger = logging.getLogger(__name__)
 
+
+def estimate_size(value: Any) -> int:
+    """Approximate the memory footprint of a cached value in bytes"""
+    seen = set()
+    stack = [value]
+    total = 0
+
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+
+    return total
+
+
+def key_namespace(key: str) -> str:
+    """Group a cache key by its prefix, e.g. chelsea_stats_2024 -> chelsea_stats"""
+    parts = key.split('_')
+    while len(parts) > 1 and parts[-1].isdigit():
+        parts.pop()
+    return '_'.join(parts)
+
+
+# name -> (compress, decompress) for values above the compression threshold
+COMPRESSORS: Dict[str, Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    'zlib': (zlib.compress, zlib.decompress)
+}
+if lz4_frame is not None:
+    COMPRESSORS['lz4'] = (lz4_frame.compress, lz4_frame.decompress)
+
+
+STAT_COUNTERS = (
+    'hits', 'misses', 'sets', 'evictions', 'expirations', 'stale_serves',
+    'negative_sets', 'degraded_serves', 'invalidations', 'early_refreshes'
+)
+
+
+class _Flight:
+    """A loader call in progress that other callers for the same key wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _Shard:
+    """
+    One lock-protected slice of the in-memory cache
+
+    Each shard keeps its own LRU order, expiry heap, byte totals, statistics
+    and in-flight loads, so threads working on different keys rarely contend.
+    Size limits apply to the whole cache and are enforced by CacheService,
+    which evicts from whichever shard holds the least recently used entry.
+    """
+
+    def __init__(self, use_clock: Iterator[int]):
+        self.lock = threading.Lock()
+        # Ordered from least to most recently used
+        self.entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Tick of each entry's last use, from a clock shared by all shards
+        self.used_at: Dict[str, int] = {}
+        self._use_clock = use_clock
+        # Min-heap of (hard expiry, key); superseded items are skipped lazily
+        self.expiry_heap: List[Tuple[float, str]] = []
+        self.total_bytes = 0
+        # Resident compressed entries and what they would occupy uncompressed
+        self.compressed_entries = 0
+        self.compressed_bytes = 0
+        self.uncompressed_bytes = 0
+        self.namespace_entries: Dict[str, int] = defaultdict(int)
+        self.namespace_bytes: Dict[str, int] = defaultdict(int)
+        self.counters: Dict[str, Dict[str, int]] = defaultdict(lambda: dict.fromkeys(STAT_COUNTERS, 0))
+        self.inflight: Dict[str, _Flight] = {}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            return self.entries.get(key)
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store an entry as most recently used"""
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = entry
+            self.used_at[key] = next(self._use_clock)
+            self._account(key, entry, 1)
+            heapq.heappush(self.expiry_heap, (entry['stale_until'], key))
+            self._compact_expiry_heap()
+
+    def touch(self, key: str) -> None:
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.used_at[key] = next(self._use_clock)
+
+    def oldest_use(self) -> Optional[int]:
+        """Last-use tick of this shard's least recently used entry, or None if empty"""
+        with self.lock:
+            if not self.entries:
+                return None
+            return self.used_at[next(iter(self.entries))]
+
+    def evict_oldest(self) -> Optional[str]:
+        """Evict this shard's least recently used entry, returning its key"""
+        with self.lock:
+            if not self.entries:
+                return None
+            key, entry = self.entries.popitem(last=False)
+            self.used_at.pop(key, None)
+            self._account(key, entry, -1)
+            self.counters[key_namespace(key)]['evictions'] += 1
+        logger.debug(f"Cache evicted least recently used key: {key}")
+        return key
+
+    def discard(self, key: str, entry: Optional[Dict[str, Any]] = None) -> bool:
+        """Remove a key, or only if it still holds the given entry"""
+        with self.lock:
+            current = self.entries.get(key)
+            if current is None or (entry is not None and current is not entry):
+                return False
+            self._remove(key)
+            return True
+
+    def pop_due(self, current_time: float) -> List[str]:
+        """Remove entries whose hard expiry has passed, visiting only those"""
+        removed = []
+        with self.lock:
+            while self.expiry_heap and self.expiry_heap[0][0] < current_time:
+                deadline, key = heapq.heappop(self.expiry_heap)
+                entry = self.entries.get(key)
+                if entry is None or entry['stale_until'] != deadline:
+                    # Entry was deleted, evicted or rewritten since this deadline was queued
+                    continue
+                self._remove(key)
+                self.counters[key_namespace(key)]['expirations'] += 1
+                removed.append(key)
+        return removed
+
+    def items(self) -> List[Tuple[str, Dict[str, Any]]]:
+        with self.lock:
+            return list(self.entries.items())
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.used_at.clear()
+            self.expiry_heap.clear()
+            self.total_bytes = 0
+            self.compressed_entries = 0
+            self.compressed_bytes = 0
+            self.uncompressed_bytes = 0
+            self.namespace_entries.clear()
+            self.namespace_bytes.clear()
+
+    def record(self, key: str, counter: str) -> None:
+        with self.lock:
+            self.counters[key_namespace(key)][counter] += 1
+
+    def _account(self, key: str, entry: Dict[str, Any], sign: int) -> None:
+        """Add (sign 1) or subtract (sign -1) an entry from the incremental totals"""
+        namespace = key_namespace(key)
+        size = sign * entry['size']
+        self.total_bytes += size
+        self.namespace_entries[namespace] += sign
+        self.namespace_bytes[namespace] += size
+        if entry.get('compressed'):
+            self.compressed_entries += sign
+            self.compressed_bytes += size
+            self.uncompressed_bytes += sign * entry['uncompressed_size']
+
+    def _remove(self, key: str) -> None:
+        """Drop an entry and release its byte count"""
+        entry = self.entries.pop(key)
+        self.used_at.pop(key, None)
+        self._account(key, entry, -1)
+
+    def _compact_expiry_heap(self) -> None:
+        """Rebuild the heap once superseded deadlines outnumber live entries"""
+        if len(self.expiry_heap) > 2 * len(self.entries) + 64:
+            self.expiry_heap = [(entry['stale_until'], key) for key, entry in self.entries.items()]
+            heapq.heapify(self.expiry_heap)
+
+
 class CacheService:
-    def __init__(self, default_ttl: int = 900):  # 15 minutes default
+    def __init__(self, default_ttl: int = 900,  # 15 minutes default
+                 max_entries: Optional[int] = None,
+                 max_bytes: Optional[int] = None,
+                 num_shards: int = 16,
+                 early_refresh_beta: float = 1.0,
+                 compression_threshold: Optional[int] = None,
+                 compression: str = 'zlib'):
         """
         Initialize cache service
-        
+
         Args:
             default_ttl: Default time-to-live in seconds
+            max_entries: Maximum number of entries kept (None for unbounded)
+            max_bytes: Approximate memory ceiling in bytes (None for unbounded)
+            num_shards: Number of independently locked shards; limits apply to all of them together
+            early_refresh_beta: How eagerly get_or_compute refreshes entries before
+                they expire (0 disables, above 1 refreshes earlier)
+            compression_threshold: Values estimated at or above this many bytes are
+                stored pickled and compressed (None disables compression)
+            compression: Compressor for large values, 'zlib' or 'lz4'
         """
-        self.cache: Dict[str, Dict[str, Any]] = {}
         self.default_ttl = default_ttl
-        
+        self.early_refresh_beta = early_refresh_beta
+        self.compression_threshold = compression_threshold
+        if compression not in COMPRESSORS:
+            logger.warning(f"Cache compression '{compression}' unavailable, using zlib")
+            compression = 'zlib'
+        self.compression = compression
+        # Totals for every value this process compressed, including ones since evicted
+        self._compression_totals = {'values': 0, 'uncompressed_bytes': 0, 'compressed_bytes': 0}
+        self._compression_lock = threading.Lock()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        use_clock = itertools.count()
+        self._shards = [_Shard(use_clock) for _ in range(num_shards)]
+        self._evict_lock = threading.Lock()
+        self._sweeper_interval: Optional[float] = None
+        self._sweeper_pid: Optional[int] = None
+        self._snapshot_path: Optional[str] = None
+        self._snapshot_interval: Optional[float] = None
+        self._snapshotter_pid: Optional[int] = None
+        # Current version of each tag; bumping a version invalidates every entry stamped with an older one
+        self._tag_versions_by_tag: Dict[str, int] = {}
+        self._tags_lock = threading.Lock()
+        # Tag invalidations so far, and how many the last sweep had seen
+        self._tag_bumps = 0
+        self._swept_tag_bumps = 0
+
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache if not expired"""
-        if key not in self.cache:
+        cache_entry = self._lookup(key, record=True)
+        if cache_entry is None:
             return None
-            
-        cache_entry = self.cache[key]
-        current_time = time.time()
-        
-        if current_time > cache_entry['expires_at']:
-            # Cache expired, remove entry
-            del self.cache[key]
+        if cache_entry.get('negative'):
+            # A cached failure only has something to offer if a good value preceded it
+            return cache_entry['last_good']
+        return self._entry_value(cache_entry)
+
+    def peek_with_info(self, key: str) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        """
+        Read a value without ever loading it
+
+        Stale and degraded values are returned as get_or_compute_with_info
+        would serve them, but no refresh is started.
+
+        Returns:
+            Tuple of value and freshness info, or None if nothing is cached
+        """
+        cache_entry = self._lookup(key, record=True) or self._lookup_stale(key)
+        if cache_entry is None:
             return None
-            
-        logger.debug(f"Cache hit for key: {key}")
-        return cache_entry['data']
-    
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
-        """Set value in cache with TTL"""
+        return self._serve(key, cache_entry)
+
+    def get_or_compute(self, key: str, loader: Callable[[], Any], ttl: Optional[int] = None,
+                       cache_if: Optional[Callable[[Any], bool]] = None,
+                       stale_ttl: Optional[int] = None,
+                       negative_ttl: Optional[float] = None,
+                       max_negative_ttl: Optional[float] = None,
+                       tags: Optional[Iterable[str]] = None) -> Any:
+        """
+        Get value from cache, computing it with loader on a miss
+
+        Only one caller per key runs the loader at a time; concurrent callers
+        for the same key wait for that result instead of loading it again.
+        Within the stale window the old value is returned immediately and
+        refreshed in a background thread.
+
+        Shortly before expiry, a hit may also trigger a background refresh
+        (XFetch). The chance rises as expiry nears and with how long the
+        loader took last time, so hot, slow keys are renewed before anyone
+        has to wait at the expiry edge.
+
+        Args:
+            key: Cache key
+            loader: Zero-argument callable producing the value
+            ttl: Soft time-to-live in seconds for the computed value
+            cache_if: Predicate deciding whether a computed value is cached
+            stale_ttl: Seconds past the soft TTL during which the stale value is served
+            negative_ttl: Seconds to cache a value rejected by cache_if before
+                retrying; doubles on each consecutive failure
+            max_negative_ttl: Upper bound for the negative TTL backoff
+            tags: Tags stamped on the cached value, see invalidate_tag
+
+        Returns:
+            Cached or freshly computed value; after a failure, the last good
+            value if one is still held
+        """
+        value, _ = self.get_or_compute_with_info(
+            key, loader, ttl, cache_if, stale_ttl, negative_ttl, max_negative_ttl, tags
+        )
+        return value
+
+    def get_or_compute_with_info(self, key: str, loader: Callable[[], Any], ttl: Optional[int] = None,
+                                 cache_if: Optional[Callable[[Any], bool]] = None,
+                                 stale_ttl: Optional[int] = None,
+                                 negative_ttl: Optional[float] = None,
+                                 max_negative_ttl: Optional[float] = None,
+                                 tags: Optional[Iterable[str]] = None) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Same as get_or_compute, also reporting where the value came from
+
+        Returns:
+            Tuple of value and a dict with from_cache, stale and age_seconds,
+            plus degraded, failures and error when serving a cached failure
+        """
+        policy = {
+            'ttl': ttl,
+            'cache_if': cache_if,
+            'stale_ttl': stale_ttl,
+            'negative_ttl': negative_ttl,
+            'max_negative_ttl': max_negative_ttl,
+            'tags': tags
+        }
+
+        cache_entry = self._lookup(key, record=True)
+        if cache_entry is not None:
+            if self._should_refresh_early(cache_entry) and self._start_background_refresh(key, loader, policy):
+                self._record(key, 'early_refreshes')
+            return self._serve(key, cache_entry)
+
+        stale_entry = self._lookup_stale(key)
+        if stale_entry is not None:
+            self._record(key, 'stale_serves')
+            self._start_background_refresh(key, loader, policy)
+            return self._serve(key, stale_entry)
+
+        flight, is_leader = self._join_flight(key)
+        if not is_leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            value, info = flight.value
+            return value, {**info, 'from_cache': True}
+
+        # A previous leader may have filled the entry after our miss
+        cache_entry = self._lookup(key, record=False)
+        if cache_entry is not None:
+            result = self._serve(key, cache_entry)
+            self._finish_flight(key, flight, result)
+            return result
+
+        return self._run_loader(key, flight, loader, policy)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None,
+            stale_ttl: Optional[int] = None, tags: Optional[Iterable[str]] = None,
+            compute_seconds: float = 0.0, tag_versions: Optional[Dict[str, int]] = None) -> None:
+        """
+        Set value in cache with TTL, an optional stale window and invalidation tags
+
+        compute_seconds records how long producing the value took, which
+        weights early refreshes in get_or_compute. tag_versions, taken with
+        tag_versions() before the value was loaded, stamps the entry with the
+        versions the value was read under, so a tag invalidated while it was
+        loading still invalidates it.
+        """
         if ttl is None:
             ttl = self.default_ttl
-            
+
         expires_at = time.time() + ttl
-        
-        self.cache[key] = {
+        size = estimate_size(value)
+
+        entry = {
             'data': value,
             'expires_at': expires_at,
-            'created_at': time.time()
+            'stale_until': expires_at + (stale_ttl or 0),
+            'created_at': time.time(),
+            'size': size,
+            'tags': self._stamp_tags(tags, tag_versions),
+            'compute_seconds': compute_seconds
         }
-        
+        if self.compression_threshold is not None and size >= self.compression_threshold:
+            self._compress_entry(entry)
+
+        size_limit = self._value_size_limit(key)
+        if size_limit is not None and entry['size'] > size_limit:
+            self._discard(key)
+            logger.debug(f"Cache skipped for key: {key}, {entry['size']} bytes exceeds limit")
+            return
+
+        self._write_entry(key, entry)
+        self._record(key, 'sets')
+
         logger.debug(f"Cache set for key: {key}, expires in {ttl} seconds")
-    
+
+    def set_failure(self, key: str, failure: Any, negative_ttl: float,
+                    max_negative_ttl: Optional[float] = None,
+                    tags: Optional[Iterable[str]] = None,
+                    tag_versions: Optional[Dict[str, int]] = None) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Cache a failed load the way get_or_compute does, for loaders that run outside it
+
+        Returns:
+            What readers are now served, with its freshness info: the last
+            good value marked degraded if one is held, else the failure
+        """
+        entry = self._set_negative(key, failure, negative_ttl, max_negative_ttl, tags, tag_versions)
+        return self._serve(key, entry)
+
+    def tag_versions(self, tags: Optional[Iterable[str]]) -> Optional[Dict[str, int]]:
+        """Current versions of tags, to pass to set or set_failure for a value about to be loaded"""
+        return self._tag_versions(tags) if tags else None
+
     def delete(self, key: str) -> bool:
         """Delete specific cache entry"""
-        if key in self.cache:
-            del self.cache[key]
+        if self._discard(key):
             logger.debug(f"Cache deleted for key: {key}")
             return True
         return False
-    
+
+    def invalidate_tag(self, tag: str) -> int:
+        """
+        Invalidate every entry carrying tag
+
+        Entries record the tag's version when written; bumping the version makes
+        them all misses at once without visiting them. They are dropped when
+        next read, or by the next sweep, which walks the cache only after a
+        tag has been invalidated.
+
+        Returns:
+            The tag's new version
+        """
+        version = self._bump_tag(tag)
+        logger.debug(f"Cache invalidated tag: {tag} (version {version})")
+        return version
+
     def clear(self) -> None:
         """Clear all cache entries"""
-        self.cache.clear()
+        for shard in self._shards:
+            shard.clear()
         logger.debug("Cache cleared")
-    
+
     def cleanup_expired(self) -> int:
         """Remove expired entries and return count of removed items"""
         current_time = time.time()
-        expired_keys = []
-        
-        for key, entry in self.cache.items():
-            if current_time > entry['expires_at']:
-                expired_keys.append(key)
-        
-        for key in expired_keys:
-            del self.cache[key]
-            
-        if expired_keys:
-            logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
-            
-        return len(expired_keys)
-    
+        removed = sum(len(shard.pop_due(current_time)) for shard in self._shards)
+        invalidated = self._drop_invalidated()
+
+        if removed or invalidated:
+            logger.debug(f"Cleaned up {removed} expired and {invalidated} invalidated cache entries")
+
+        return removed + invalidated
+
+    def start_sweeper(self, interval: float = 60) -> None:
+        """Run cleanup_expired every interval seconds in a background thread"""
+        self._sweeper_interval = interval
+        self._ensure_sweeper()
+
+    def save_snapshot(self, path: str) -> int:
+        """
+        Write unexpired entries to a SQLite file
+
+        The snapshot is written to a temporary file and moved into place, so
+        a crash mid-write never leaves a truncated snapshot behind.
+
+        Returns:
+            Number of entries written
+        """
+        current_time = time.time()
+        rows = [
+            (key, pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL), entry['stale_until'])
+            for shard in self._shards
+            for key, entry in shard.items()
+            if entry['stale_until'] > current_time and self._tags_current(entry)
+        ]
+
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+        connection = sqlite3.connect(temp_path)
+        try:
+            connection.execute(
+                "CREATE TABLE cache_entries (key TEXT PRIMARY KEY, entry BLOB NOT NULL, stale_until REAL NOT NULL)"
+            )
+            connection.executemany("INSERT INTO cache_entries VALUES (?, ?, ?)", rows)
+            connection.commit()
+        finally:
+            connection.close()
+
+        os.replace(temp_path, path)
+        logger.debug(f"Cache snapshot saved with {len(rows)} entries to {path}")
+        return len(rows)
+
+    def load_snapshot(self, path: str) -> int:
+        """
+        Restore entries from a SQLite snapshot, keeping their original expiry times
+
+        Returns:
+            Number of entries restored
+        """
+        if not os.path.exists(path):
+            return 0
+
+        try:
+            connection = sqlite3.connect(path)
+            try:
+                rows = connection.execute(
+                    "SELECT key, entry FROM cache_entries WHERE stale_until > ?", (time.time(),)
+                ).fetchall()
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to read cache snapshot {path}: {str(e)}")
+            return 0
+
+        restored = 0
+        for key, payload in rows:
+            try:
+                entry = pickle.loads(payload)
+                self._restore_tag_versions(entry.get('tags'))
+                self._write_entry(key, entry)
+                restored += 1
+            except Exception as e:
+                logger.error(f"Skipping unreadable snapshot entry {key}: {str(e)}")
+
+        logger.info(f"Cache warmed with {restored} entries from snapshot {path}")
+        return restored
+
+    def enable_snapshots(self, path: str, interval: float = 300) -> int:
+        """
+        Restore from path now, then snapshot every interval seconds and at exit
+
+        Returns:
+            Number of entries restored (0 if snapshots to path are already enabled)
+        """
+        if self._snapshot_path == path:
+            return 0
+        restored = self.load_snapshot(path)
+        self._snapshot_path = path
+        self._snapshot_interval = interval
+        self._ensure_snapshotter()
+        atexit.register(self._save_snapshot_safely)
+        return restored
+
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
+        expired_entries = self.cleanup_expired()
+        counters = self._merged_counters()
+        namespace_entries: Dict[str, int] = defaultdict(int)
+        namespace_bytes: Dict[str, int] = defaultdict(int)
+        total_entries = 0
+        pending_expirations = 0
+
+        for shard in self._shards:
+            with shard.lock:
+                total_entries += len(shard.entries)
+                pending_expirations += len(shard.expiry_heap)
+                for namespace, count in shard.namespace_entries.items():
+                    namespace_entries[namespace] += count
+                for namespace, size in shard.namespace_bytes.items():
+                    namespace_bytes[namespace] += size
+
+        return {
+            'total_entries': total_entries,
+            'expired_entries': expired_entries,
+            'pending_expirations': pending_expirations,
+            'cache_size_bytes': self.total_bytes,
+            'max_entries': self.max_entries,
+            'max_bytes': self.max_bytes,
+            'shards': len(self._shards),
+            'backend': 'memory',
+            'compression': {
+                **self._compression_stats(),
+                'resident_entries': sum(shard.compressed_entries for shard in self._shards),
+                'resident_compressed_bytes': sum(shard.compressed_bytes for shard in self._shards),
+                'resident_uncompressed_bytes': sum(shard.uncompressed_bytes for shard in self._shards)
+            },
+            **self._summarize_counters(self._totals(counters)),
+            'namespaces': {
+                namespace: {
+                    'entries': namespace_entries.get(namespace, 0),
+                    'size_bytes': namespace_bytes.get(namespace, 0),
+                    **self._summarize_counters(namespace_counters)
+                }
+                for namespace, namespace_counters in sorted(counters.items())
+            }
+        }
+
+    @property
+    def total_bytes(self) -> int:
+        """Approximate bytes held across all shards"""
+        return sum(shard.total_bytes for shard in self._shards)
+
+    def __len__(self) -> int:
+        return sum(len(shard.entries) for shard in self._shards)
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss counters without touching cached entries"""
+        for shard in self._shards:
+            with shard.lock:
+                shard.counters.clear()
+
+    def _lookup(self, key: str, record: bool) -> Optional[Dict[str, Any]]:
+        """Return a live entry, optionally counting the hit or miss"""
+        cache_entry = self._read_valid_entry(key)
+        if cache_entry is None:
+            if record:
+                self._record(key, 'misses')
+            return None
+
         current_time = time.time()
-        active_entries = 0
-        expired_entries = 0
-        
-        for entry in self.cache.values():
-            if current_time > entry['expires_at']:
-                expired_entries += 1
+
+        if current_time > cache_entry['expires_at']:
+            if current_time > cache_entry['stale_until']:
+                # Cache expired, remove entry unless another thread already replaced it
+                if self._expire(key, cache_entry):
+                    self._record(key, 'expirations')
+            if record:
+                self._record(key, 'misses')
+            return None
+
+        self._touch(key)
+        if record:
+            self._record(key, 'hits')
+            logger.debug(f"Cache hit for key: {key}")
+        return cache_entry
+
+    def _lookup_stale(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return an entry if it is past its soft TTL but inside the stale window"""
+        cache_entry = self._read_valid_entry(key)
+        if cache_entry is None:
+            return None
+
+        current_time = time.time()
+        if cache_entry['expires_at'] < current_time <= cache_entry['stale_until']:
+            return cache_entry
+        return None
+
+    def _serve(self, key: str, cache_entry: Dict[str, Any]) -> Tuple[Any, Dict[str, Any]]:
+        """Return the value a cache entry stands for, with its freshness info"""
+        current_time = time.time()
+
+        if not cache_entry.get('negative'):
+            return self._entry_value(cache_entry), {
+                'from_cache': True,
+                'stale': current_time > cache_entry['expires_at'],
+                'age_seconds': round(current_time - cache_entry['created_at'], 1)
+            }
+
+        self._record(key, 'degraded_serves')
+        info = {
+            'from_cache': True,
+            'stale': True,
+            'degraded': True,
+            'failures': cache_entry['failures'],
+            'error': cache_entry['data'],
+            'retry_in_seconds': round(max(0.0, cache_entry['expires_at'] - current_time), 1)
+        }
+
+        if cache_entry['last_good'] is None:
+            return cache_entry['data'], {**info, 'age_seconds': 0.0}
+
+        return cache_entry['last_good'], {
+            **info,
+            'age_seconds': round(current_time - cache_entry['last_good_created_at'], 1)
+        }
+
+    def _set_negative(self, key: str, failure: Any, negative_ttl: float,
+                      max_negative_ttl: Optional[float],
+                      tags: Optional[Iterable[str]] = None,
+                      tag_versions: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        """
+        Cache a failed load, backing off exponentially on consecutive failures
+
+        The previous good value is carried over so readers can fall back to it.
+        """
+        previous = self._read_valid_entry(key)
+        failures = 1
+        last_good = None
+        last_good_created_at = None
+        keep_until = 0.0
+
+        if previous is not None:
+            keep_until = previous['stale_until']
+            if previous.get('negative'):
+                failures = previous['failures'] + 1
+                last_good = previous['last_good']
+                last_good_created_at = previous['last_good_created_at']
             else:
-                active_entries += 1
-        
+                last_good = self._entry_value(previous)
+                last_good_created_at = previous['created_at']
+
+        backoff = negative_ttl * 2 ** (failures - 1)
+        if max_negative_ttl is not None:
+            backoff = min(backoff, max_negative_ttl)
+
+        current_time = time.time()
+        expires_at = current_time + backoff
+        entry = {
+            'data': failure,
+            'negative': True,
+            'failures': failures,
+            'last_good': last_good,
+            'last_good_created_at': last_good_created_at,
+            'expires_at': expires_at,
+            # Keep the entry past its retry time so the failure count and last good value survive
+            'stale_until': max(keep_until, expires_at + (max_negative_ttl or backoff)),
+            'created_at': current_time,
+            'size': estimate_size(failure) + estimate_size(last_good),
+            # Tagged failures are dropped with their tag too, so an invalidation retries at once
+            'tags': self._stamp_tags(tags, tag_versions)
+        }
+        self._write_entry(key, entry)
+        self._record(key, 'negative_sets')
+        logger.debug(f"Cache stored failure #{failures} for key: {key}, retry in {backoff} seconds")
+        return entry
+
+    def _join_flight(self, key: str) -> Tuple[_Flight, bool]:
+        """Register interest in loading a key; the first caller becomes the leader"""
+        shard = self._shard_for(key)
+        with shard.lock:
+            flight = shard.inflight.get(key)
+            if flight is not None:
+                return flight, False
+            flight = _Flight()
+            shard.inflight[key] = flight
+            return flight, True
+
+    def _finish_flight(self, key: str, flight: _Flight, value: Any = None,
+                       error: Optional[BaseException] = None) -> None:
+        """Publish the leader's result to waiting callers"""
+        flight.value = value
+        flight.error = error
+        shard = self._shard_for(key)
+        with shard.lock:
+            del shard.inflight[key]
+        flight.done.set()
+
+    def _run_loader(self, key: str, flight: _Flight, loader: Callable[[], Any],
+                    policy: Dict[str, Any]) -> Tuple[Any, Dict[str, Any]]:
+        """Run the loader as flight leader and cache its result"""
+        try:
+            # Versions as of the start of the load: an invalidation during it must still apply
+            tag_versions = self.tag_versions(policy['tags'])
+            started = time.time()
+            value = loader()
+            compute_seconds = time.time() - started
+            cache_if = policy['cache_if']
+            if value is not None and (cache_if is None or cache_if(value)):
+                self.set(key, value, policy['ttl'], policy['stale_ttl'], policy['tags'], compute_seconds, tag_versions)
+                result = value, {'from_cache': False, 'stale': False, 'age_seconds': 0.0}
+            elif value is not None and policy['negative_ttl']:
+                entry = self._set_negative(
+                    key, value, policy['negative_ttl'], policy['max_negative_ttl'], policy['tags'], tag_versions
+                )
+                result = self._serve(key, entry)
+            else:
+                result = value, {'from_cache': False, 'stale': False, 'age_seconds': 0.0}
+        except BaseException as e:
+            self._finish_flight(key, flight, error=e)
+            raise
+        self._finish_flight(key, flight, result)
+        return result
+
+    def _should_refresh_early(self, cache_entry: Dict[str, Any]) -> bool:
+        """
+        XFetch test: refresh if now - compute_seconds * beta * ln(rand) passes expiry
+
+        -ln(rand) is exponentially distributed, so a refresh is unlikely while
+        expiry is many loader-durations away and near certain right before it.
+        """
+        compute_seconds = cache_entry.get('compute_seconds', 0.0)
+        if cache_entry.get('negative') or not compute_seconds or self.early_refresh_beta <= 0:
+            return False
+
+        # 1 - random() lies in (0, 1], keeping the logarithm finite
+        head_start = -compute_seconds * self.early_refresh_beta * math.log(1.0 - random.random())
+        return time.time() + head_start >= cache_entry['expires_at']
+
+    def _start_background_refresh(self, key: str, loader: Callable[[], Any],
+                                  policy: Dict[str, Any]) -> bool:
+        """Reload a key on a background thread unless a load is already running"""
+        flight, is_leader = self._join_flight(key)
+        if is_leader:
+            threading.Thread(
+                target=self._refresh_in_background,
+                args=(key, flight, loader, policy),
+                name=f"cache-refresh-{key}",
+                daemon=True
+            ).start()
+        return is_leader
+
+    def _refresh_in_background(self, key: str, flight: _Flight, loader: Callable[[], Any],
+                               policy: Dict[str, Any]) -> None:
+        """Revalidate a stale or soon-to-expire entry off the request path"""
+        try:
+            self._run_loader(key, flight, loader, policy)
+            logger.debug(f"Cache refreshed stale key in background: {key}")
+        except Exception as e:
+            logger.error(f"Background refresh failed for cache key {key}: {str(e)}")
+
+    def _compress_entry(self, entry: Dict[str, Any]) -> None:
+        """Replace an entry's value with its compressed pickle, if that is smaller"""
+        compress, _ = COMPRESSORS[self.compression]
+        try:
+            payload = compress(pickle.dumps(entry['data'], protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception as e:
+            logger.debug(f"Cache value not compressible, storing as is: {str(e)}")
+            return
+
+        compressed_size = sys.getsizeof(payload)
+        if compressed_size >= entry['size']:
+            return
+
+        with self._compression_lock:
+            self._compression_totals['values'] += 1
+            self._compression_totals['uncompressed_bytes'] += entry['size']
+            self._compression_totals['compressed_bytes'] += compressed_size
+
+        entry.update({
+            'data': payload,
+            'compressed': self.compression,
+            'uncompressed_size': entry['size'],
+            'size': compressed_size
+        })
+
+    @staticmethod
+    def _entry_value(cache_entry: Dict[str, Any]) -> Any:
+        """Return an entry's value, decompressing it if it was stored compressed"""
+        compression = cache_entry.get('compressed')
+        if not compression:
+            return cache_entry['data']
+        _, decompress = COMPRESSORS[compression]
+        return pickle.loads(decompress(cache_entry['data']))
+
+    def _compression_stats(self) -> Dict[str, Any]:
+        """Compression settings and the ratio achieved on values compressed so far"""
+        with self._compression_lock:
+            totals = dict(self._compression_totals)
         return {
-            'total_entries': len(self.cache),
-            'active_entries': active_entries,
-            'expired_entries': expired_entries,
-            'cache_size_bytes': len(str(self.cache))
+            'algorithm': self.compression if self.compression_threshold is not None else None,
+            'threshold_bytes': self.compression_threshold,
+            **totals,
+            'ratio': round(totals['uncompressed_bytes'] / totals['compressed_bytes'], 2)
+            if totals['compressed_bytes'] else None
+        }
+
+    def _read_valid_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Fetch the raw entry for a key, dropping it if one of its tags was invalidated"""
+        cache_entry = self._read_entry(key)
+        if cache_entry is None or self._tags_current(cache_entry):
+            return cache_entry
+
+        if self._expire(key, cache_entry):
+            self._record(key, 'invalidations')
+        return None
+
+    def _stamp_tags(self, tags: Optional[Iterable[str]],
+                    tag_versions: Optional[Dict[str, int]]) -> Optional[Dict[str, int]]:
+        """Tag versions to store on an entry: those given, else the current ones"""
+        if tag_versions is not None:
+            return tag_versions
+        return self._tag_versions(tags) if tags else None
+
+    def _tags_current(self, cache_entry: Dict[str, Any]) -> bool:
+        """Whether every tag on an entry still has the version it was written with"""
+        tags = cache_entry.get('tags')
+        return not tags or self._tag_versions(tags) == tags
+
+    def _shard_for(self, key: str) -> _Shard:
+        """Pick the shard responsible for a key"""
+        return self._shards[hash(key) % len(self._shards)]
+
+    def _record(self, key: str, counter: str) -> None:
+        """Increment a statistics counter for the key's namespace"""
+        self._shard_for(key).record(key, counter)
+
+    def _merged_counters(self) -> Dict[str, Dict[str, int]]:
+        """Combine per-shard counters by namespace"""
+        merged: Dict[str, Dict[str, int]] = defaultdict(lambda: dict.fromkeys(STAT_COUNTERS, 0))
+        for shard in self._shards:
+            with shard.lock:
+                for namespace, counters in shard.counters.items():
+                    for name, value in counters.items():
+                        merged[namespace][name] += value
+        return merged
+
+    @staticmethod
+    def _totals(counters: Dict[str, Dict[str, int]]) -> Dict[str, int]:
+        """Sum counters across all namespaces"""
+        totals = dict.fromkeys(STAT_COUNTERS, 0)
+        for namespace_counters in counters.values():
+            for name, value in namespace_counters.items():
+                totals[name] += value
+        return totals
+
+    @staticmethod
+    def _summarize_counters(counters: Dict[str, int]) -> Dict[str, Any]:
+        """Add hit ratio to a set of counters"""
+        lookups = counters['hits'] + counters['misses']
+        return {
+            **counters,
+            'hit_ratio': round(counters['hits'] / lookups, 4) if lookups else None
         }
 
+    def _read_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Fetch the raw entry for a key, expired or not"""
+        return self._shard_for(key).get(key)
+
+    def _value_size_limit(self, key: str) -> Optional[int]:
+        """Largest value the cache can hold"""
+        return self.max_bytes
+
+    def _write_entry(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store an entry as most recently used and enforce the size limits"""
+        self._shard_for(key).put(key, entry)
+        self._evict()
+        self._ensure_sweeper()
+
+    def _over_limits(self) -> bool:
+        """Whether the cache as a whole holds more entries or bytes than allowed"""
+        return (
+            (self.max_entries is not None and len(self) > self.max_entries) or
+            (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+        )
+
+    def _evict(self) -> None:
+        """Evict the least recently used entries across all shards until within the limits"""
+        if self.max_entries is None and self.max_bytes is None:
+            return
+        with self._evict_lock:
+            while self._over_limits():
+                candidates = [(shard.oldest_use(), shard) for shard in self._shards]
+                candidates = [(used, shard) for used, shard in candidates if used is not None]
+                if not candidates:
+                    return
+                min(candidates, key=lambda candidate: candidate[0])[1].evict_oldest()
+        self._ensure_snapshotter()
+
+    def _touch(self, key: str) -> None:
+        """Mark an entry as most recently used"""
+        self._shard_for(key).touch(key)
+
+    def _discard(self, key: str) -> bool:
+        """Remove an entry if present"""
+        return self._shard_for(key).discard(key)
+
+    def _expire(self, key: str, entry: Dict[str, Any]) -> bool:
+        """Remove an expired entry, unless the key has since been rewritten"""
+        return self._shard_for(key).discard(key, entry)
+
+    def _tag_versions(self, tags: Iterable[str]) -> Dict[str, int]:
+        """Current version of each tag (reads are atomic under the GIL, so no lock)"""
+        return {tag: self._tag_versions_by_tag.get(tag, 0) for tag in tags}
+
+    def _bump_tag(self, tag: str) -> int:
+        """Advance a tag's version"""
+        with self._tags_lock:
+            version = self._tag_versions_by_tag.get(tag, 0) + 1
+            self._tag_versions_by_tag[tag] = version
+            self._tag_bumps += 1
+            return version
+
+    def _drop_invalidated(self) -> int:
+        """Remove entries with an invalidated tag, visiting the cache only if a tag was invalidated since the last sweep"""
+        tag_bumps = self._tag_bumps
+        if tag_bumps == self._swept_tag_bumps:
+            return 0
+        self._swept_tag_bumps = tag_bumps
+
+        dropped = 0
+        for shard in self._shards:
+            for key, entry in shard.items():
+                if not self._tags_current(entry) and shard.discard(key, entry):
+                    self._record(key, 'invalidations')
+                    dropped += 1
+        return dropped
+
+    def _restore_tag_versions(self, versions: Optional[Dict[str, int]]) -> None:
+        """Raise tag versions so entries restored from a snapshot stay valid"""
+        if not versions:
+            return
+        with self._tags_lock:
+            for tag, version in versions.items():
+                if version > self._tag_versions_by_tag.get(tag, 0):
+                    self._tag_versions_by_tag[tag] = version
+
+    def _ensure_sweeper(self) -> None:
+        """Start the sweeper thread once per process (threads do not survive fork)"""
+        if self._sweeper_interval is None or self._sweeper_pid == os.getpid():
+            return
+        self._sweeper_pid = os.getpid()
+        threading.Thread(target=self._sweep, name="cache-sweeper", daemon=True).start()
+
+    def _sweep(self) -> None:
+        """Periodically drop entries that are due"""
+        while True:
+            time.sleep(self._sweeper_interval)
+            try:
+                self.cleanup_expired()
+            except Exception as e:
+                logger.error(f"Cache sweeper error: {str(e)}")
+
+    def _ensure_snapshotter(self) -> None:
+        """Start the periodic snapshot thread once per process"""
+        if self._snapshot_interval is None or self._snapshotter_pid == os.getpid():
+            return
+        self._snapshotter_pid = os.getpid()
+        threading.Thread(target=self._snapshot_periodically, name="cache-snapshotter", daemon=True).start()
+
+    def _snapshot_periodically(self) -> None:
+        """Save a snapshot every snapshot interval"""
+        while True:
+            time.sleep(self._snapshot_interval)
+            self._save_snapshot_safely()
+
+    def _save_snapshot_safely(self) -> None:
+        """Save a snapshot, logging instead of raising on failure"""
+        try:
+            self.save_snapshot(self._snapshot_path)
+        except Exception as e:
+            logger.error(f"Failed to save cache snapshot {self._snapshot_path}: {str(e)}")
+
+
+class RedisCacheService(CacheService):
+    """CacheService storing entries in Redis so all workers share one cache"""
+
+    def __init__(self, client: Any, default_ttl: int = 900, prefix: str = 'bluesbook:cache:',
+                 max_bytes: Optional[int] = None, early_refresh_beta: float = 1.0,
+                 compression_threshold: Optional[int] = None, compression: str = 'zlib'):
+        """
+        Initialize Redis-backed cache service
+
+        Args:
+            client: redis.Redis compatible client
+            default_ttl: Default time-to-live in seconds
+            prefix: Prefix applied to every Redis key
+            max_bytes: Largest single value accepted, in approximate bytes
+            early_refresh_beta: How eagerly entries are refreshed before they expire
+            compression_threshold: Values at or above this many bytes are stored compressed
+            compression: Compressor for large values, 'zlib' or 'lz4'
+        """
+        super().__init__(
+            default_ttl=default_ttl, max_bytes=max_bytes, early_refresh_beta=early_refresh_beta,
+            compression_threshold=compression_threshold, compression=compression
+        )
+        self.client = client
+        self.prefix = prefix
+        # Tag versions live in one hash outside the entry prefix, shared by all workers
+        self.tags_key = f"{prefix.rstrip(':')}-tags"
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> 'RedisCacheService':
+        """Create a cache service connected to the Redis server at url"""
+        if redis is None:
+            raise RuntimeError("redis package is not installed")
+        return cls(redis.Redis.from_url(url), **kwargs)
+
+    def clear(self) -> None:
+        """Clear all cache entries under this service's prefix"""
+        keys = list(self.client.scan_iter(match=f"{self.prefix}*"))
+        if keys:
+            self.client.delete(*keys)
+        logger.debug("Cache cleared")
+
+    def cleanup_expired(self) -> int:
+        """Redis expires entries itself once their stale window has passed"""
+        return 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics; counters are local to this worker"""
+        counters = self._merged_counters()
+        return {
+            'total_entries': sum(1 for _ in self.client.scan_iter(match=f"{self.prefix}*")),
+            'max_bytes': self.max_bytes,
+            'backend': 'redis',
+            'compression': self._compression_stats(),
+            **self._summarize_counters(self._totals(counters)),
+            'namespaces': {
+                namespace: self._summarize_counters(namespace_counters)
+                for namespace, namespace_counters in sorted(counters.items())
+            }
+        }
+
+    def _value_size_limit(self, key: str) -> Optional[int]:
+        """Largest single value accepted"""
+        return self.max_bytes
+
+    def _read_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Fetch and decode the entry stored in Redis"""
+        payload = self.client.get(self.prefix + key)
+        if payload is None:
+            return None
+        try:
+            return pickle.loads(payload)
+        except Exception as e:
+            logger.error(f"Discarding unreadable cache entry {key}: {str(e)}")
+            self._discard(key)
+            return None
+
+    def _write_entry(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store the entry with a Redis TTL matching the end of its stale window"""
+        ttl_ms = max(1, int((entry['stale_until'] - time.time()) * 1000))
+        self.client.set(self.prefix + key, pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL), px=ttl_ms)
+
+    def _touch(self, key: str) -> None:
+        """Recency is handled by the Redis maxmemory policy"""
+
+    def _discard(self, key: str) -> bool:
+        """Delete the entry from Redis"""
+        return bool(self.client.delete(self.prefix + key))
+
+    def _expire(self, key: str, entry: Dict[str, Any]) -> bool:
+        """Redis drops the key itself when its TTL runs out"""
+        return True
+
+    def _tag_versions(self, tags: Iterable[str]) -> Dict[str, int]:
+        """Current version of each tag, read from the shared hash"""
+        tags = list(tags)
+        versions = self.client.hmget(self.tags_key, tags)
+        return {tag: int(version or 0) for tag, version in zip(tags, versions)}
+
+    def _bump_tag(self, tag: str) -> int:
+        """Advance a tag's version for every worker"""
+        return int(self.client.hincrby(self.tags_key, tag, 1))
+
+
+class TieredCacheService(CacheService):
+    """
+    Two-tier cache: a small in-process L1 in front of a shared Redis L2
+
+    Writes and deletes are broadcast over Redis pub/sub so every worker
+    drops its L1 copy of the key. Tag versions are kept in L1 the same way,
+    so checking an L1 entry's tags normally needs no Redis round trip.
+    """
+
+    INVALIDATION_CHANNEL = 'bluesbook:cache:invalidate'
+    TAG_VERSION_PREFIX = '__tag_version__:'
+
+    def __init__(self, l2: RedisCacheService, l1_max_entries: int = 128, l1_ttl: int = 5):
+        """
+        Initialize tiered cache service
+
+        Args:
+            l2: Shared Redis-backed cache
+            l1_max_entries: Maximum entries held in the in-process tier
+            l1_ttl: Seconds an L1 copy is trusted, bounding staleness if a broadcast is missed
+        """
+        super().__init__(
+            default_ttl=l2.default_ttl, max_bytes=l2.max_bytes, early_refresh_beta=l2.early_refresh_beta,
+            compression_threshold=l2.compression_threshold, compression=l2.compression
+        )
+        self.l2 = l2
+        self.l1 = CacheService(default_ttl=l1_ttl, max_entries=l1_max_entries)
+        self.l1_ttl = l1_ttl
+        self.node_id = uuid.uuid4().hex
+        self._listener_pid: Optional[int] = None
+        self._listener_lock = threading.Lock()
+
+    def clear(self) -> None:
+        """Clear both tiers and tell other workers to drop their L1"""
+        self.l2.clear()
+        self.l1.clear()
+        self._broadcast('*')
+
+    def cleanup_expired(self) -> int:
+        """Remove expired L1 copies; Redis expires L2 entries itself"""
+        return self.l1.cleanup_expired()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statistics for the combined cache and each tier"""
+        counters = self._merged_counters()
+        return {
+            **self.l2.get_stats(),
+            **self._summarize_counters(self._totals(counters)),
+            'backend': 'tiered',
+            'compression': self._compression_stats(),
+            'namespaces': {
+                namespace: self._summarize_counters(namespace_counters)
+                for namespace, namespace_counters in sorted(counters.items())
+            },
+            'l1': self.l1.get_stats()
+        }
+
+    def _value_size_limit(self, key: str) -> Optional[int]:
+        """Values are limited by the shared tier"""
+        return self.l2._value_size_limit(key)
+
+    def _read_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read from L1, falling back to L2 and promoting the entry"""
+        self._ensure_listener()
+
+        entry = self.l1.get(key)
+        if entry is not None:
+            return entry
+
+        entry = self.l2._read_entry(key)
+        if entry is not None:
+            self._promote(key, entry)
+        return entry
+
+    def _write_entry(self, key: str, entry: Dict[str, Any]) -> None:
+        """Write through to L2, keep a local copy and invalidate other workers"""
+        self.l2._write_entry(key, entry)
+        self._promote(key, entry)
+        self._broadcast(key)
+
+    def _touch(self, key: str) -> None:
+        """Recency only matters for the L1 tier, which get() already updates"""
+
+    def _discard(self, key: str) -> bool:
+        """Delete from both tiers and invalidate other workers"""
+        self.l1.delete(key)
+        removed = self.l2._discard(key)
+        self._broadcast(key)
+        return removed
+
+    def _expire(self, key: str, entry: Dict[str, Any]) -> bool:
+        """Drop the local copy; Redis expires the shared one"""
+        self.l1.delete(key)
+        return True
+
+    def _tag_versions(self, tags: Iterable[str]) -> Dict[str, int]:
+        """Current tag versions from L1, fetching missing ones from L2"""
+        versions = {}
+        missing = []
+        for tag in tags:
+            version = self.l1.get(self.TAG_VERSION_PREFIX + tag)
+            if version is None:
+                missing.append(tag)
+            else:
+                versions[tag] = version
+
+        if missing:
+            for tag, version in self.l2._tag_versions(missing).items():
+                self.l1.set(self.TAG_VERSION_PREFIX + tag, version, ttl=self.l1_ttl)
+                versions[tag] = version
+
+        return versions
+
+    def _bump_tag(self, tag: str) -> int:
+        """Advance the shared version and tell other workers to drop their L1 copy"""
+        version = self.l2._bump_tag(tag)
+        self.l1.set(self.TAG_VERSION_PREFIX + tag, version, ttl=self.l1_ttl)
+        self._broadcast(self.TAG_VERSION_PREFIX + tag)
+        return version
+
+    def _promote(self, key: str, entry: Dict[str, Any]) -> None:
+        """Keep an L1 copy no longer than the L1 TTL or the entry's own lifetime"""
+        ttl = min(self.l1_ttl, entry['stale_until'] - time.time())
+        if ttl > 0:
+            self.l1.set(key, entry, ttl=ttl)
+
+    def _broadcast(self, key: str) -> None:
+        """Publish an invalidation for key ('*' for everything)"""
+        try:
+            self.l2.client.publish(self.INVALIDATION_CHANNEL, f"{self.node_id}|{key}")
+        except Exception as e:
+            logger.error(f"Failed to broadcast cache invalidation for {key}: {str(e)}")
+
+    def _ensure_listener(self) -> None:
+        """Start the invalidation listener once per process (threads do not survive fork)"""
+        if self._listener_pid == os.getpid():
+            return
+
+        with self._listener_lock:
+            if self._listener_pid == os.getpid():
+                return
+            # A forked worker may have inherited L1 entries it will never hear about
+            self.l1.clear()
+            threading.Thread(target=self._listen, name="cache-invalidation-listener", daemon=True).start()
+            self._listener_pid = os.getpid()
+
+    def _listen(self) -> None:
+        """Drop L1 copies invalidated by other workers"""
+        while True:
+            try:
+                pubsub = self.l2.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.INVALIDATION_CHANNEL)
+                for message in pubsub.listen():
+                    data = message.get('data')
+                    if isinstance(data, bytes):
+                        data = data.decode('utf-8')
+                    origin, _, key = str(data).partition('|')
+                    if origin == self.node_id:
+                        continue
+                    if key == '*':
+                        self.l1.clear()
+                    else:
+                        self.l1.delete(key)
+            except Exception as e:
+                logger.error(f"Cache invalidation listener error, resubscribing: {str(e)}")
+                # Messages may have been missed while disconnected
+                self.l1.clear()
+                time.sleep(1)
+
+
+def create_cache_service(default_ttl: int = 900) -> CacheService:
+    """Build the cache service selected by Config.CACHE_BACKEND"""
+    if Config.CACHE_BACKEND in ('redis', 'tiered'):
+        try:
+            cache = RedisCacheService.from_url(
+                Config.REDIS_URL, default_ttl=default_ttl, max_bytes=Config.CACHE_MAX_BYTES,
+                early_refresh_beta=Config.CACHE_EARLY_REFRESH_BETA,
+                compression_threshold=Config.CACHE_COMPRESSION_THRESHOLD or None,
+                compression=Config.CACHE_COMPRESSION
+            )
+            cache.client.ping()
+            logger.info(f"Using {Config.CACHE_BACKEND} cache backend at {Config.REDIS_URL}")
+            if Config.CACHE_BACKEND == 'tiered':
+                tiered = TieredCacheService(
+                    cache, l1_max_entries=Config.CACHE_L1_MAX_ENTRIES, l1_ttl=Config.CACHE_L1_TTL
+                )
+                tiered.l1.start_sweeper(Config.CACHE_SWEEP_INTERVAL)
+                return tiered
+            return cache
+        except Exception as e:
+            logger.error(f"Redis cache unavailable, falling back to in-memory cache: {str(e)}")
+
+    cache = CacheService(
+        default_ttl=default_ttl,
+        max_entries=Config.CACHE_MAX_ENTRIES,
+        max_bytes=Config.CACHE_MAX_BYTES,
+        early_refresh_beta=Config.CACHE_EARLY_REFRESH_BETA,
+        compression_threshold=Config.CACHE_COMPRESSION_THRESHOLD or None,
+        compression=Config.CACHE_COMPRESSION
+    )
+    cache.start_sweeper(Config.CACHE_SWEEP_INTERVAL)
+    return cache
+
 # Global cache instance for API-Football data
-api_football_cache = CacheService(default_ttl=900)  # 15 minutes for football data
\ No newline at end of file
+api_football_cache = create_cache_service(default_ttl=900)  # 15 minutes for football data
+
+# Cache for results derived from the bundled local data
+local_data_cache = CacheService(default_ttl=3600, max_entries=256)
+
+_caching_enabled = Config.CACHE_ENABLED
+
+
+def caching_enabled() -> bool:
+    """Whether @cached functions currently use the cache"""
+    return _caching_enabled
+
+
+def set_caching_enabled(enabled: bool) -> None:
+    """Switch @cached on or off process-wide, e.g. in tests"""
+    global _caching_enabled
+    _caching_enabled = enabled
+
+
+@contextmanager
+def caching_disabled() -> Iterator[None]:
+    """Run a block with @cached functions calling straight through"""
+    previous = _caching_enabled
+    set_caching_enabled(False)
+    try:
+        yield
+    finally:
+        set_caching_enabled(previous)
+
+
+def cached(ttl: Union[float, Callable[..., float]],
+           key: Union[str, Callable[..., str], None] = None,
+           cache: Optional[CacheService] = None,
+           cache_if: Optional[Callable[[Any], bool]] = None,
+           stale_ttl: Optional[float] = None,
+           negative_ttl: Optional[float] = None,
+           max_negative_ttl: Optional[float] = None,
+           tags: Union[Iterable[str], Callable[..., Iterable[str]], None] = None,
+           annotate: Optional[Callable[[Any, Dict[str, Any]], Any]] = None) -> Callable:
+    """
+    Cache a function or method's results through CacheService.get_or_compute
+
+    Args:
+        ttl: Soft TTL in seconds, or a callable taking the call's arguments by name
+        key: Key template formatted with the call's arguments by name
+            (e.g. "team_stats_{self.chelsea_team_id}_{self.current_season}"), a callable taking
+            them by name, or None to build one from the function name and arguments
+        cache: CacheService to use (defaults to api_football_cache)
+        cache_if: Predicate deciding whether a result is cached
+        stale_ttl: Seconds the result may be served stale while refreshing
+        negative_ttl: Seconds to cache a result rejected by cache_if, with backoff
+        max_negative_ttl: Upper bound for the negative TTL backoff
+        tags: Tag templates formatted like key (e.g. "season:{self.current_season}"),
+            or a callable taking the call's arguments by name and returning tags
+        annotate: Callable receiving (result, cache info) and returning the value to hand back
+
+    The wrapper exposes uncached (the original function), plus cache_key(...),
+    cache_settings(...), invalidate(...) and peek(...), which take the same
+    arguments as the function. cache_settings lets code that cannot go through
+    the wrapper (e.g. async loaders) read and write the same entries; peek
+    returns the cached result (annotated, possibly stale) or None, never
+    calling the function.
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        # An empty CacheService is falsy (it defines __len__), so compare to None
+        target = cache if cache is not None else api_football_cache
+
+        def bind(args: tuple, kwargs: dict) -> Dict[str, Any]:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return bound.arguments
+
+        def build_key(arguments: Dict[str, Any]) -> str:
+            if key is None:
+                parts = [func.__name__] + [
+                    str(value) for name, value in arguments.items() if name not in ('self', 'cls')
+                ]
+                return '_'.join(parts)
+            if callable(key):
+                return key(**arguments)
+            return key.format(**arguments)
+
+        def build_tags(arguments: Dict[str, Any]) -> Optional[List[str]]:
+            if tags is None:
+                return None
+            if callable(tags):
+                return list(tags(**arguments))
+            return [tag.format(**arguments) for tag in tags]
+
+        def cache_key(*args: Any, **kwargs: Any) -> str:
+            return build_key(bind(args, kwargs))
+
+        def cache_settings(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+            arguments = bind(args, kwargs)
+            return {
+                'cache': target,
+                'key': build_key(arguments),
+                'ttl': ttl(**arguments) if callable(ttl) else ttl,
+                'stale_ttl': stale_ttl,
+                'negative_ttl': negative_ttl,
+                'max_negative_ttl': max_negative_ttl,
+                'tags': build_tags(arguments),
+                'cache_if': cache_if,
+                'annotate': annotate
+            }
+
+        def invalidate(*args: Any, **kwargs: Any) -> bool:
+            return target.delete(cache_key(*args, **kwargs))
+
+        def peek(*args: Any, **kwargs: Any) -> Any:
+            cached_value = target.peek_with_info(cache_key(*args, **kwargs))
+            if cached_value is None:
+                return None
+            value, info = cached_value
+            return annotate(value, info) if annotate else value
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _caching_enabled:
+                return func(*args, **kwargs)
+
+            arguments = bind(args, kwargs)
+            value, info = target.get_or_compute_with_info(
+                build_key(arguments),
+                lambda: func(*args, **kwargs),
+                ttl=ttl(**arguments) if callable(ttl) else ttl,
+                cache_if=cache_if,
+                stale_ttl=stale_ttl,
+                negative_ttl=negative_ttl,
+                max_negative_ttl=max_negative_ttl,
+                tags=build_tags(arguments)
+            )
+            return annotate(value, info) if annotate else value
+
+        wrapper.uncached = func
+        wrapper.cache_key = cache_key
+        wrapper.cache_settings = cache_settings
+        wrapper.invalidate = invalidate
+        wrapper.peek = peek
+        return wrapper
+
+    return decorator
@@ -0,0 +1,175 @@
+"""
+Circuit breakers for Blue's Book upstream APIs
+Stop calling a host that keeps failing, so requests fail fast instead of
+each waiting out its timeout while worker threads pile up
+"""
+
+import threading
+import time
+import logging
+from datetime import datetime
+from urllib.parse import urlsplit
+from typing import Dict, Any, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request to a host whose circuit is open"""
+
+
+class CircuitBreaker:
+    """
+    Closed, open and half-open states for one upstream host
+
+    Closed: requests flow, consecutive failures are counted. Open: reached
+    after failure_threshold failures in a row; requests are refused until
+    reset_timeout has passed. Half-open: one trial request is let through;
+    success closes the circuit, failure opens it again.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30):
+        """
+        Initialize circuit breaker
+
+        Args:
+            name: Host the breaker guards, for logs and status
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a trial request
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.times_opened = 0
+        self.rejected = 0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Whether a request may be sent now; moving to half-open claims the single trial"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+
+            if self.state == self.OPEN and time.time() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+                logger.info(f"Circuit for {self.name} half-open, sending a trial request")
+
+            if self.state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+
+            self.rejected += 1
+            return False
+
+    def release(self) -> None:
+        """A request allowed by allow_request was not sent after all; free the half-open trial"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._trial_in_flight = False
+
+    def is_open(self) -> bool:
+        """Whether a request would be refused right now (counted as rejected), without claiming a trial"""
+        with self._lock:
+            if self.state == self.OPEN:
+                refused = time.time() - self.opened_at < self.reset_timeout
+            else:
+                refused = self.state == self.HALF_OPEN and self._trial_in_flight
+            if refused:
+                self.rejected += 1
+            return refused
+
+    def retry_in(self) -> float:
+        """Seconds until the next trial request is allowed"""
+        with self._lock:
+            if self.state != self.OPEN:
+                return 0.0
+            return round(max(0.0, self.opened_at + self.reset_timeout - time.time()), 1)
+
+    def record_success(self) -> None:
+        """A request completed; close the circuit"""
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info(f"Circuit for {self.name} closed")
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """A request failed; open the circuit at the threshold, or again after a failed trial"""
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.times_opened += 1
+                    logger.warning(f"Circuit for {self.name} opened after {self.failures} consecutive failures")
+                self.state = self.OPEN
+                self.opened_at = time.time()
+                self._trial_in_flight = False
+
+    def get_status(self) -> Dict[str, Any]:
+        """State and counters for the health endpoint"""
+        retry_in = self.retry_in()
+        with self._lock:
+            return {
+                'state': self.state,
+                'consecutive_failures': self.failures,
+                'opened_at': datetime.fromtimestamp(self.opened_at).isoformat() if self.opened_at else None,
+                'retry_in_seconds': retry_in,
+                'times_opened': self.times_opened,
+                'rejected': self.rejected
+            }
+
+
+class CircuitBreakerRegistry:
+    """One circuit breaker per upstream host, created on first use"""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30, enabled: bool = True):
+        """
+        Initialize registry
+
+        Args:
+            failure_threshold: Consecutive failures that open a host's circuit
+            reset_timeout: Seconds a circuit stays open before a trial request
+            enabled: When False, every circuit stays closed
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.enabled = enabled
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def for_url(self, url: str) -> CircuitBreaker:
+        """The breaker guarding url's host"""
+        host = urlsplit(url).netloc
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(
+                    host, CircuitBreaker(host, self.failure_threshold, self.reset_timeout)
+                )
+        return breaker
+
+    def allow_request(self, url: str) -> bool:
+        """Whether a request to url may be sent now"""
+        return not self.enabled or self.for_url(url).allow_request()
+
+    def is_open(self, url: str) -> bool:
+        """Whether requests to url are currently refused"""
+        return self.enabled and self.for_url(url).is_open()
+
+    def get_status(self) -> Dict[str, Dict[str, Any]]:
+        """Status of every host's breaker"""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {host: breaker.get_status() for host, breaker in breakers.items()}
@@ -3,13 +3,19 @@ Data loader service for Blue's Book
 Handles API-Football integration and data synchronization
 """
 
-import requests
 import json
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 import time
 from config import Config
 from services.firebase_service import firebase_service
+from services.cache_service import cached
+from services.http_client import http_client
+from services.rapidapi_quota import rapidapi_quota
+
+def _found(result: Any) -> bool:
+    """Only cache lookups that returned data"""
+    return result is not None
 
 class DataLoader:
     """Service class for loading and syncing data from API-Football"""
@@ -27,9 +33,20 @@ class DataLoader:
     
     def _make_request(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
         """Make API request to API-Football"""
+        if http_client.circuit_open(self.base_url):
+            print(f"API request to {endpoint} skipped: API-Football circuit open")
+            return None
+        
+        delay = rapidapi_quota.reserve()
+        if delay is None:
+            print(f"API request to {endpoint} skipped: RapidAPI quota or rate limit reached")
+            return None
+        time.sleep(delay)
+        
         try:
             url = f"{self.base_url}/{endpoint}"
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
+            response = http_client.get(url, headers=self.headers, params=params, timeout=10)
+            rapidapi_quota.record(response.status_code, response.headers)
             
             if response.status_code == 200:
                 return response.json()
@@ -40,6 +57,7 @@ class DataLoader:
             print(f"Error making API request: {e}")
             return None
     
+    @cached(ttl=6 * 3600, key="squad_{self.team_id}", cache_if=bool)
     def get_chelsea_squad(self) -> List[Dict]:
         """Get current Chelsea FC squad from API-Football"""
         try:
@@ -132,6 +150,7 @@ class DataLoader:
             "Professional footballer"
         ]
     
+    @cached(ttl=24 * 3600, key="player_transfers_{player_id}", cache_if=_found)
     def _get_transfer_info(self, player_id: int) -> Optional[Dict]:
         """Get transfer information for a player"""
         try:
@@ -192,6 +211,7 @@ class DataLoader:
         # 3. Apply position-based salary ranges
         return "£50,000-£100,000"  # Placeholder range
     
+    @cached(ttl=24 * 3600, key="manager_{self.team_id}", cache_if=_found)
     def get_current_manager(self) -> Optional[Dict]:
         """Get current Chelsea manager from API-Football"""
         try:
@@ -257,6 +277,7 @@ class DataLoader:
         
         return sync_results
     
+    @cached(ttl=3600, key="player_statistics_{player_id}", cache_if=_found)
     def get_player_statistics(self, player_id: int) -> Optional[Dict]:
         """Get detailed statistics for a specific player"""
         try:
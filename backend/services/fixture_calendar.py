@@ -0,0 +1,211 @@
+"""
+Fixture calendar for Blue's Book
+Tracks known kickoff times so API-Football data can be cached for hours
+between matches and only briefly while a match is live
+"""
+
+import threading
+import time
+import logging
+from datetime import datetime
+from typing import Dict, Any, Optional, Iterable, List, Callable, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def kickoff_timestamp(date: Optional[str]) -> Optional[float]:
+    """Parse an API-Football fixture date (ISO 8601 with offset) into a timestamp"""
+    if not date:
+        return None
+    try:
+        return datetime.fromisoformat(date.replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        logger.debug(f"Unparseable fixture date: {date}")
+        return None
+
+
+class FixtureCalendar:
+    """
+    Known kickoffs and the live windows around them
+
+    A live window runs from prematch_seconds before kickoff to live_seconds
+    after it, long enough to cover stoppage time and extra time.
+
+    With a store, the fixtures are also kept in the cache under store_key
+    and merged back in every sync_interval seconds, so workers that read
+    fixtures from a shared cache, or restart from a snapshot, know the same
+    kickoffs as the worker that fetched them.
+    """
+
+    def __init__(self, prematch_seconds: float = 900, live_seconds: float = 9000,
+                 min_ttl: float = 30, store: Any = None, store_key: str = 'fixture_calendar',
+                 store_ttl: float = 14 * 86400, sync_interval: float = 30):
+        """
+        Initialize fixture calendar
+
+        Args:
+            prematch_seconds: How long before kickoff the live window opens
+            live_seconds: How long after kickoff the live window stays open
+            min_ttl: Shortest TTL handed out when a live window is about to open
+            store: Cache (get/set) sharing the fixtures, or None to keep them in this process only
+            store_key: Key the fixtures are stored under
+            store_ttl: How long the stored fixtures are kept
+            sync_interval: Seconds between reads of the stored fixtures
+        """
+        self.prematch_seconds = prematch_seconds
+        self.live_seconds = live_seconds
+        self.min_ttl = min_ttl
+        self.store = store
+        self.store_key = store_key
+        self.store_ttl = store_ttl
+        self.sync_interval = sync_interval
+        self._kickoffs: Dict[float, bool] = {}  # kickoff -> finished
+        self._fixture_ids: Dict[float, int] = {}  # kickoff -> API-Football fixture id
+        self._synced_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def add_kickoffs(self, kickoffs: Iterable[Optional[float]]) -> None:
+        """Remember upcoming kickoffs, forgetting ones whose window has long closed"""
+        self.add_fixtures((kickoff, None) for kickoff in kickoffs)
+
+    def add_fixtures(self, fixtures: Iterable[Tuple[Optional[float], Optional[int]]]) -> None:
+        """Remember upcoming (kickoff, fixture id) pairs, forgetting ones whose window has long closed"""
+        self._sync(force=True)
+        with self._lock:
+            changed = self._merge((kickoff, fixture_id, False) for kickoff, fixture_id in fixtures)
+        if changed:
+            self._save()
+
+    def mark_finished(self, kickoffs: Iterable[Optional[float]]) -> List[float]:
+        """Record finished fixtures, returning the tracked ones not already known to be over"""
+        self._sync(force=True)
+        newly_finished = []
+        with self._lock:
+            for kickoff in kickoffs:
+                if self._kickoffs.get(kickoff) is False:
+                    self._kickoffs[kickoff] = True
+                    newly_finished.append(kickoff)
+        if newly_finished:
+            self._save()
+        return newly_finished
+
+    def in_live_window(self, current_time: Optional[float] = None) -> bool:
+        """Whether an unfinished tracked fixture is around kickoff or in play"""
+        self._sync()
+        current_time = time.time() if current_time is None else current_time
+        with self._lock:
+            return any(
+                kickoff - self.prematch_seconds <= current_time <= kickoff + self.live_seconds
+                for kickoff, finished in self._kickoffs.items() if not finished
+            )
+
+    def live_fixture(self, current_time: Optional[float] = None) -> Optional[Tuple[float, int]]:
+        """(kickoff, fixture id) of the unfinished fixture whose live window is open, if its id is known"""
+        self._sync()
+        current_time = time.time() if current_time is None else current_time
+        with self._lock:
+            live = [
+                (kickoff, self._fixture_ids[kickoff]) for kickoff, finished in self._kickoffs.items()
+                if not finished and kickoff in self._fixture_ids
+                and kickoff - self.prematch_seconds <= current_time <= kickoff + self.live_seconds
+            ]
+        return min(live) if live else None
+
+    def seconds_until_live(self, current_time: Optional[float] = None) -> Optional[float]:
+        """Seconds until the next live window opens, or None if no fixture is known"""
+        self._sync()
+        current_time = time.time() if current_time is None else current_time
+        with self._lock:
+            starts = [
+                kickoff - self.prematch_seconds for kickoff, finished in self._kickoffs.items()
+                if not finished and kickoff - self.prematch_seconds > current_time
+            ]
+        return min(starts) - current_time if starts else None
+
+    def ttl(self, idle_ttl: float, live_ttl: float) -> float:
+        """
+        TTL for data that changes around matches
+
+        live_ttl during a live window; otherwise idle_ttl, cut short so the
+        entry expires no later than the next window opens.
+        """
+        current_time = time.time()
+        if self.in_live_window(current_time):
+            return live_ttl
+
+        until_live = self.seconds_until_live(current_time)
+        if until_live is None:
+            return idle_ttl
+        return max(self.min_ttl, min(idle_ttl, until_live))
+
+    def ttl_policy(self, idle_ttl: float, live_ttl: float) -> Callable[..., float]:
+        """A ttl callable for @cached that ignores the call's arguments"""
+        return lambda **_: self.ttl(idle_ttl, live_ttl)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Tracked fixtures and the current window, for diagnostics"""
+        current_time = time.time()
+        with self._lock:
+            fixtures = [
+                {
+                    'kickoff': datetime.fromtimestamp(kickoff).isoformat(),
+                    'fixture_id': self._fixture_ids.get(kickoff),
+                    'finished': finished
+                }
+                for kickoff, finished in sorted(self._kickoffs.items())
+            ]
+        return {
+            'live': self.in_live_window(current_time),
+            'seconds_until_live': self.seconds_until_live(current_time),
+            'fixtures': fixtures
+        }
+
+    def _merge(self, fixtures: Iterable[Tuple[Optional[float], Optional[int], bool]]) -> bool:
+        """Add (kickoff, fixture id, finished) entries and prune old ones; caller holds the lock"""
+        changed = False
+        for kickoff, fixture_id, finished in fixtures:
+            if kickoff is None:
+                continue
+            if kickoff not in self._kickoffs or (finished and not self._kickoffs[kickoff]):
+                self._kickoffs[kickoff] = self._kickoffs.get(kickoff, False) or finished
+                changed = True
+            if fixture_id is not None and self._fixture_ids.get(kickoff) != fixture_id:
+                self._fixture_ids[kickoff] = fixture_id
+                changed = True
+
+        current_time = time.time()
+        for kickoff in [k for k in self._kickoffs if k + self.live_seconds < current_time - 86400]:
+            del self._kickoffs[kickoff]
+            self._fixture_ids.pop(kickoff, None)
+        return changed
+
+    def _sync(self, force: bool = False) -> None:
+        """Merge in fixtures other workers stored, at most once per sync interval unless forced"""
+        if self.store is None:
+            return
+        current_time = time.time()
+        if not force and self._synced_at is not None and current_time - self._synced_at < self.sync_interval:
+            return
+        self._synced_at = current_time
+
+        try:
+            stored = self.store.get(self.store_key) or []
+        except Exception as e:
+            logger.warning(f"Could not read stored fixture calendar: {str(e)}")
+            return
+        with self._lock:
+            self._merge((entry['kickoff'], entry.get('fixture_id'), entry.get('finished', False)) for entry in stored)
+
+    def _save(self) -> None:
+        """Write this process's fixtures to the store"""
+        if self.store is None:
+            return
+        with self._lock:
+            stored = [
+                {'kickoff': kickoff, 'fixture_id': self._fixture_ids.get(kickoff), 'finished': finished}
+                for kickoff, finished in self._kickoffs.items()
+            ]
+        try:
+            self.store.set(self.store_key, stored, ttl=self.store_ttl)
+        except Exception as e:
+            logger.warning(f"Could not store fixture calendar: {str(e)}")
@@ -4,28 +4,117 @@ Provides current season statistics, live match data, and real-time information
 """
 
 import os
+import json
+import time
+import hashlib
 import requests
 import logging
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from datetime import datetime, timedelta
 
-# Import cache service
+# Import cache service (always through the services package so there is one cache per process)
 try:
-    from .cache_service import api_football_cache
+    from .cache_service import cached, api_football_cache, CacheService
+    from .http_client import http_client
+    from .fixture_calendar import FixtureCalendar, kickoff_timestamp
+    from .rapidapi_quota import rapidapi_quota
 except ImportError:
-    import sys
-    sys.path.append(os.path.dirname(__file__))
-    from cache_service import api_football_cache
+    from services.cache_service import cached, api_football_cache, CacheService
+    from services.http_client import http_client
+    from services.fixture_calendar import FixtureCalendar, kickoff_timestamp
+    from services.rapidapi_quota import rapidapi_quota
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class FootballAPIService:
-    def __init__(self):
+# How long expired data may still be served while it refreshes in the background
+STALE_TTL = int(os.getenv('API_FOOTBALL_STALE_TTL', 3600))
+
+# Failed calls are cached briefly, backing off up to the maximum, so errors don't trigger retry storms
+NEGATIVE_TTL = int(os.getenv('API_FOOTBALL_NEGATIVE_TTL', 30))
+MAX_NEGATIVE_TTL = int(os.getenv('API_FOOTBALL_MAX_NEGATIVE_TTL', 600))
+
+# Overall budget for the combined current-data call; sections still running are left out
+COMPREHENSIVE_DEADLINE = float(os.getenv('API_FOOTBALL_COMPREHENSIVE_DEADLINE', 12))
+
+# Default team and season; only a client on both keeps the fixture calendar current
+TRACKED_TEAM_ID = 40  # Chelsea FC team ID in API-Football
+TRACKED_SEASON = 2024  # 2024-25 Premier League
+
+# Live window around each known kickoff; sections are cached briefly inside it and for hours outside
+FIXTURE_PREMATCH_MINUTES = int(os.getenv('API_FOOTBALL_PREMATCH_MINUTES', 15))
+FIXTURE_LIVE_MINUTES = int(os.getenv('API_FOOTBALL_LIVE_MINUTES', 150))
+
+# Kickoffs seen in upcoming fixtures, shared by every client in the process and, through the
+# cache, with workers that read fixtures from a shared cache or restore them from a snapshot
+fixture_calendar = FixtureCalendar(
+    prematch_seconds=FIXTURE_PREMATCH_MINUTES * 60,
+    live_seconds=FIXTURE_LIVE_MINUTES * 60,
+    store=api_football_cache
+)
+
+# Validators (ETag, Last-Modified, payload hash) and formatted result of the last response per request,
+# so an unchanged upstream payload is neither parsed nor reformatted
+PAYLOAD_VALIDATOR_TTL = int(os.getenv('API_FOOTBALL_VALIDATOR_TTL', 86400))
+payload_validators = CacheService(default_ttl=PAYLOAD_VALIDATOR_TTL, max_entries=128)
+
+# Shared pool for fetching sections concurrently; late sections finish here and still fill the cache
+_section_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="api-football-section")
+
+def _is_available(data: Dict[str, Any]) -> bool:
+    """Only successful API-Football sections are cached"""
+    return data.get('available', False)
+
+def _annotate_cache_info(result: Dict[str, Any], cache_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Mark a section served from cache with its age, staleness and degraded state"""
+    if not cache_info['from_cache']:
+        return result
+    
+    result = {
+        **result,
+        'from_cache': True,
+        'stale': cache_info['stale'],
+        'cache_age_seconds': cache_info['age_seconds']
+    }
+    
+    # After a failed refresh, the last good value is served with an explicit degraded flag
+    if cache_info.get('degraded'):
+        result['degraded'] = True
+        result['upstream_error'] = cache_info['error'].get('error')
+        result['retry_in_seconds'] = cache_info['retry_in_seconds']
+    
+    return result
+
+# Cache tags: every section is tagged with its season, plus what a finished match changes
+SEASON_TAG = "season:{self.current_season}"
+FIXTURES_TAG = "fixtures"
+RESULTS_TAG = "results"
+
+# Written in place by the live match tracker while a match is on, never fetched on read
+LIVE_MATCH_KEY = "live_match_{team_id}"
+
+def football_cached(idle_ttl: int, live_ttl: int, key: str, tags: List[str]):
+    """
+    Cache an API-Football section with stale serving, negative caching and tags
+    
+    Entries live idle_ttl seconds between matches, never past the opening of
+    the next live window, and live_ttl seconds while a match is on.
+    """
+    return cached(
+        ttl=fixture_calendar.ttl_policy(idle_ttl, live_ttl), key=key, cache_if=_is_available, stale_ttl=STALE_TTL,
+        negative_ttl=NEGATIVE_TTL, max_negative_ttl=MAX_NEGATIVE_TTL,
+        tags=[SEASON_TAG] + tags, annotate=_annotate_cache_info
+    )
+
+class FootballAPIBase:
+    """Configuration, request specs and response formatting shared by the sync and async clients"""
+    
+    def __init__(self, team_id: Optional[int] = None, season: Optional[int] = None):
         self.api_key = os.getenv('API_FOOTBALL_KEY')
         self.base_url = os.getenv('API_FOOTBALL_URL', 'https://api-football-v1.p.rapidapi.com/v3')
-        self.chelsea_team_id = 40  # Chelsea FC team ID in API-Football
+        self.chelsea_team_id = team_id or TRACKED_TEAM_ID
         
         # Headers for API requests
         self.headers = {
@@ -36,157 +125,189 @@ class FootballAPIService:
         if not self.api_key or self.api_key == 'your-api-football-key-here':
             logger.warning("API_FOOTBALL_KEY not found or not configured")
             
-        # Current season (2024-25 Premier League)
-        self.current_season = 2024
+        # Current season
+        self.current_season = season or TRACKED_SEASON
         self.premier_league_id = 39
         
     def is_available(self) -> bool:
         """Check if API-Football service is available"""
         return bool(self.api_key and self.api_key != 'your-api-football-key-here')
     
-    def get_current_season_stats(self) -> Dict[str, Any]:
-        """Get Chelsea's current season statistics with caching"""
-        cache_key = f"chelsea_stats_{self.current_season}"
-        
-        # Try cache first
-        cached_data = api_football_cache.get(cache_key)
-        if cached_data:
-            cached_data['from_cache'] = True
-            return cached_data
-        
-        if not self.is_available():
-            return {"error": "API-Football service not available", "available": False}
-            
-        try:
-            # Get team statistics for current season
-            url = f"{self.base_url}/teams/statistics"
-            params = {
-                'league': self.premier_league_id,
-                'season': self.current_season,
-                'team': self.chelsea_team_id
+    def invalidate_after_match(self) -> None:
+        """Drop every cached section a finished match makes stale (fixtures, results, table)"""
+        api_football_cache.invalidate_tag(FIXTURES_TAG)
+        api_football_cache.invalidate_tag(RESULTS_TAG)
+        logger.info("Invalidated cached fixtures and results after match end")
+    
+    def invalidate_season(self, season: Optional[int] = None) -> None:
+        """Drop every cached section for a season"""
+        api_football_cache.invalidate_tag(f"season:{season or self.current_season}")
+    
+    def _section_request(self, section: str, limit: Optional[int] = None,
+                         fixture_id: Optional[int] = None) -> Dict[str, Any]:
+        """Endpoint, params and formatter for a section, shared by the sync and async clients"""
+        if section == 'season_stats':
+            return {
+                'endpoint': 'teams/statistics',
+                'params': {
+                    'league': self.premier_league_id,
+                    'season': self.current_season,
+                    'team': self.chelsea_team_id
+                },
+                'format': self._format_team_stats,
+                'empty': {},
+                'label': 'team stats'
             }
-            
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                result = self._format_team_stats(data.get('response', {}))
-                
-                # Cache successful response for 30 minutes
-                if result.get('available'):
-                    api_football_cache.set(cache_key, result, ttl=1800)
-                
-                return result
-            else:
-                logger.error(f"API-Football team stats error: {response.status_code}")
-                return {"error": f"API request failed with status {response.status_code}", "available": False}
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"API-Football request error: {str(e)}")
-            return {"error": f"Request failed: {str(e)}", "available": False}
-            
-    def get_recent_matches(self, limit: int = 5) -> Dict[str, Any]:
-        """Get Chelsea's recent match results"""
-        if not self.is_available():
-            return {"error": "API-Football service not available", "available": False}
-            
-        try:
-            url = f"{self.base_url}/fixtures"
-            params = {
-                'team': self.chelsea_team_id,
-                'last': limit,
-                'timezone': 'Europe/London'
+        if section == 'recent_matches':
+            return {
+                'endpoint': 'fixtures',
+                'params': {'team': self.chelsea_team_id, 'last': limit, 'timezone': 'Europe/London'},
+                'format': self._format_recent_matches,
+                'empty': [],
+                'label': 'recent matches'
             }
-            
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                return self._format_recent_matches(data.get('response', []))
-            else:
-                logger.error(f"API-Football recent matches error: {response.status_code}")
-                return {"error": f"API request failed with status {response.status_code}", "available": False}
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"API-Football request error: {str(e)}")
-            return {"error": f"Request failed: {str(e)}", "available": False}
-    
-    def get_next_matches(self, limit: int = 3) -> Dict[str, Any]:
-        """Get Chelsea's upcoming fixtures"""
-        if not self.is_available():
-            return {"error": "API-Football service not available", "available": False}
-            
-        try:
-            url = f"{self.base_url}/fixtures"
-            params = {
-                'team': self.chelsea_team_id,
-                'next': limit,
-                'timezone': 'Europe/London'
+        if section == 'next_matches':
+            return {
+                'endpoint': 'fixtures',
+                'params': {'team': self.chelsea_team_id, 'next': limit, 'timezone': 'Europe/London'},
+                'format': self._format_upcoming_matches,
+                'empty': [],
+                'label': 'upcoming matches'
             }
-            
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                return self._format_upcoming_matches(data.get('response', []))
-            else:
-                logger.error(f"API-Football upcoming matches error: {response.status_code}")
-                return {"error": f"API request failed with status {response.status_code}", "available": False}
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"API-Football request error: {str(e)}")
-            return {"error": f"Request failed: {str(e)}", "available": False}
-    
-    def get_league_standings(self) -> Dict[str, Any]:
-        """Get current Premier League table with Chelsea's position"""
-        if not self.is_available():
-            return {"error": "API-Football service not available", "available": False}
-            
-        try:
-            url = f"{self.base_url}/standings"
-            params = {
-                'league': self.premier_league_id,
-                'season': self.current_season
+        if section == 'live_match':
+            return {
+                'endpoint': 'fixtures',
+                'params': {'id': fixture_id, 'timezone': 'Europe/London'},
+                'format': self._format_live_match,
+                'empty': [],
+                'label': 'live match'
             }
-            
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                return self._format_league_standings(data.get('response', []))
-            else:
-                logger.error(f"API-Football standings error: {response.status_code}")
-                return {"error": f"API request failed with status {response.status_code}", "available": False}
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"API-Football request error: {str(e)}")
-            return {"error": f"Request failed: {str(e)}", "available": False}
+        if section == 'standings':
+            return {
+                'endpoint': 'standings',
+                'params': {'league': self.premier_league_id, 'season': self.current_season},
+                'format': self._format_league_standings,
+                'empty': [],
+                'label': 'standings'
+            }
+        if section == 'squad_stats':
+            return {
+                'endpoint': 'players',
+                'params': {
+                    'team': self.chelsea_team_id,
+                    'season': self.current_season,
+                    'league': self.premier_league_id
+                },
+                'format': self._format_squad_stats,
+                'empty': [],
+                'label': 'squad stats'
+            }
+        raise ValueError(f"Unknown API-Football section: {section}")
     
-    def get_current_squad_stats(self) -> Dict[str, Any]:
-        """Get current squad with this season's player statistics"""
-        if not self.is_available():
-            return {"error": "API-Football service not available", "available": False}
-            
+    def _quota_refusal(self) -> Dict[str, Any]:
+        """Section returned instead of a request the RapidAPI quota guard refused"""
+        if rapidapi_quota.is_cache_only():
+            error = "API-Football daily quota nearly used up - serving cached data only"
+        else:
+            error = "API-Football rate limit reached - try again shortly"
+        logger.warning(error)
+        return {"error": error, "available": False, "quota_limited": True}
+    
+    def _circuit_open_error(self) -> Dict[str, Any]:
+        """
+        Section returned while API-Football's circuit is open
+        
+        Like any failed section it is cached briefly, so callers get the last
+        good value, marked degraded, when there is one.
+        """
+        return {
+            "error": "API-Football is failing - circuit open, not calling it for now",
+            "available": False,
+            "circuit_open": True
+        }
+    
+    def _validator_key(self, request: Dict[str, Any]) -> str:
+        """Key of a request's stored validators"""
+        params = '&'.join(f"{name}={value}" for name, value in sorted(request['params'].items()))
+        return f"{request['endpoint']}?{params}"
+    
+    def _conditional_headers(self, request: Dict[str, Any]) -> Tuple[Dict[str, str], Optional[Dict[str, Any]]]:
+        """Request headers with If-None-Match / If-Modified-Since from the last response, and its validators"""
+        validator = payload_validators.get(self._validator_key(request))
+        headers = dict(self.headers)
+        if validator:
+            if validator['etag']:
+                headers['If-None-Match'] = validator['etag']
+            if validator['last_modified']:
+                headers['If-Modified-Since'] = validator['last_modified']
+        return headers, validator
+    
+    def _parse_response(self, request: Dict[str, Any], validator: Optional[Dict[str, Any]], status_code: int,
+                        response_headers: Any, body: bytes) -> Dict[str, Any]:
+        """
+        Turn a response into a section, reusing the last formatted result when unchanged
+        
+        A 304, or a 200 whose body hashes the same as last time, returns the
+        stored result without parsing JSON or running the formatter.
+        """
+        if validator and status_code == 304:
+            logger.debug(f"API-Football {request['label']} not modified")
+            return validator['result']
+        if status_code != 200:
+            return self._parse_section(request, status_code, None)
+        
+        payload_hash = hashlib.sha256(body).hexdigest()
+        if validator and validator['hash'] == payload_hash:
+            logger.debug(f"API-Football {request['label']} payload unchanged")
+            return validator['result']
+        
         try:
-            url = f"{self.base_url}/players"
-            params = {
-                'team': self.chelsea_team_id,
-                'season': self.current_season,
-                'league': self.premier_league_id
-            }
-            
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                return self._format_squad_stats(data.get('response', []))
-            else:
-                logger.error(f"API-Football squad stats error: {response.status_code}")
-                return {"error": f"API request failed with status {response.status_code}", "available": False}
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"API-Football request error: {str(e)}")
-            return {"error": f"Request failed: {str(e)}", "available": False}
+            payload = json.loads(body)
+        except ValueError:
+            logger.error(f"API-Football {request['label']} returned invalid JSON")
+            return {"error": "Invalid response from API-Football", "available": False}
+        
+        result = self._parse_section(request, status_code, payload)
+        if result.get('available'):
+            payload_validators.set(self._validator_key(request), {
+                'etag': response_headers.get('ETag'),
+                'last_modified': response_headers.get('Last-Modified'),
+                'hash': payload_hash,
+                'result': result
+            })
+        return result
+    
+    def _parse_section(self, request: Dict[str, Any], status_code: int,
+                       payload: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Turn an API-Football response into a formatted section or an error"""
+        if status_code == 200:
+            result = request['format'](payload.get('response', request['empty']))
+            self._observe_fixtures(request, result)
+            return result
+        
+        logger.error(f"API-Football {request['label']} error: {status_code}")
+        return {"error": f"API request failed with status {status_code}", "available": False}
+    
+    def _observe_fixtures(self, request: Dict[str, Any], result: Dict[str, Any]) -> None:
+        """
+        Keep the fixture calendar current from fetched fixture lists
+        
+        Upcoming fixtures add kickoffs; a tracked fixture turning up among the
+        recent results means it has reached full time, so fixtures and results
+        are refreshed at once instead of waiting out their TTLs. Clients scoped
+        to another team or season leave the calendar alone: their fixtures are
+        not the tracked team's matches.
+        """
+        if not result.get('available'):
+            return
+        if self.chelsea_team_id != TRACKED_TEAM_ID or self.current_season != TRACKED_SEASON:
+            return
+        
+        kickoffs = [kickoff_timestamp(match.get('date')) for match in result.get('matches', [])]
+        if request['format'] == self._format_upcoming_matches:
+            fixture_calendar.add_fixtures(zip(kickoffs, [match.get('fixture_id') for match in result['matches']]))
+        elif request['format'] == self._format_recent_matches and fixture_calendar.mark_finished(kickoffs):
+            self.invalidate_after_match()
     
     def _format_team_stats(self, data: Dict) -> Dict[str, Any]:
         """Format team statistics response"""
@@ -270,6 +391,7 @@ class FootballAPIService:
                 teams = match.get('teams', {})
                 
                 formatted_matches.append({
+                    "fixture_id": fixture.get('id'),
                     "date": fixture.get('date'),
                     "opponent": teams.get('away', {}).get('name') if teams.get('home', {}).get('id') == self.chelsea_team_id else teams.get('home', {}).get('name'),
                     "home_away": "home" if teams.get('home', {}).get('id') == self.chelsea_team_id else "away",
@@ -288,6 +410,48 @@ class FootballAPIService:
             logger.error(f"Error formatting upcoming matches: {str(e)}")
             return {"available": False, "error": "Data formatting error"}
     
+    def _format_live_match(self, fixtures: List) -> Dict[str, Any]:
+        """Format a single fixture with its score, status and events"""
+        if not fixtures:
+            return {"available": False, "error": "Live fixture not found"}
+        
+        try:
+            match = fixtures[0]
+            fixture = match.get('fixture', {})
+            teams = match.get('teams', {})
+            goals = match.get('goals', {})
+            status = fixture.get('status', {})
+            
+            return {
+                "available": True,
+                "fixture_id": fixture.get('id'),
+                "date": fixture.get('date'),
+                "status": {
+                    "short": status.get('short'),
+                    "long": status.get('long'),
+                    "elapsed": status.get('elapsed')
+                },
+                "home": teams.get('home', {}).get('name'),
+                "away": teams.get('away', {}).get('name'),
+                "home_away": "home" if teams.get('home', {}).get('id') == self.chelsea_team_id else "away",
+                "score": f"{goals.get('home') or 0}-{goals.get('away') or 0}",
+                "events": [
+                    {
+                        "minute": event.get('time', {}).get('elapsed'),
+                        "extra": event.get('time', {}).get('extra'),
+                        "team": event.get('team', {}).get('name'),
+                        "player": event.get('player', {}).get('name'),
+                        "type": event.get('type'),
+                        "detail": event.get('detail')
+                    }
+                    for event in match.get('events') or []
+                ],
+                "last_updated": datetime.now().isoformat()
+            }
+        except Exception as e:
+            logger.error(f"Error formatting live match: {str(e)}")
+            return {"available": False, "error": "Data formatting error"}
+    
     def _format_league_standings(self, standings_data: List) -> Dict[str, Any]:
         """Format league standings with focus on Chelsea's position"""
         if not standings_data:
@@ -405,8 +569,92 @@ class FootballAPIService:
         except:
             return "unknown"
     
-    def get_comprehensive_current_data(self) -> Dict[str, Any]:
-        """Get all current Chelsea data in one call"""
+    
+    def _summarize_staleness(self, sections: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Summarize how old the cached sections of a combined response are"""
+        staleness = {}
+        for name, section in sections.items():
+            if section.get('from_cache'):
+                staleness[name] = {
+                    "age_seconds": section.get('cache_age_seconds', 0),
+                    "stale": section.get('stale', False),
+                    "degraded": section.get('degraded', False)
+                }
+        
+        return {
+            "sections": staleness,
+            "max_age_seconds": max((info["age_seconds"] for info in staleness.values()), default=0),
+            "any_stale": any(info["stale"] for info in staleness.values()),
+            "any_degraded": any(info["degraded"] for info in staleness.values())
+        }
+
+
+class FootballAPIService(FootballAPIBase):
+    """Synchronous API-Football client with cached sections"""
+    
+    @football_cached(idle_ttl=21600, live_ttl=300, key="team_stats_{self.chelsea_team_id}_{self.current_season}",
+                     tags=[RESULTS_TAG])
+    def get_current_season_stats(self) -> Dict[str, Any]:
+        """Get Chelsea's current season statistics with caching"""
+        return self._fetch_section('season_stats')
+    
+    @football_cached(idle_ttl=21600, live_ttl=60, key="team_recent_matches_{self.chelsea_team_id}_{limit}",
+                     tags=[FIXTURES_TAG, RESULTS_TAG])
+    def get_recent_matches(self, limit: int = 5) -> Dict[str, Any]:
+        """Get Chelsea's recent match results"""
+        return self._fetch_section('recent_matches', limit)
+    
+    @football_cached(idle_ttl=43200, live_ttl=300, key="team_next_matches_{self.chelsea_team_id}_{limit}",
+                     tags=[FIXTURES_TAG])
+    def get_next_matches(self, limit: int = 3) -> Dict[str, Any]:
+        """Get Chelsea's upcoming fixtures"""
+        return self._fetch_section('next_matches', limit)
+    
+    @football_cached(idle_ttl=21600, live_ttl=120, key="league_standings_{self.premier_league_id}_{self.current_season}",
+                     tags=[RESULTS_TAG])
+    def get_league_standings(self) -> Dict[str, Any]:
+        """Get current Premier League table with Chelsea's position"""
+        return self._fetch_section('standings')
+    
+    @football_cached(idle_ttl=43200, live_ttl=900, key="team_squad_stats_{self.chelsea_team_id}_{self.current_season}",
+                     tags=[RESULTS_TAG])
+    def get_current_squad_stats(self) -> Dict[str, Any]:
+        """Get current squad with this season's player statistics"""
+        return self._fetch_section('squad_stats')
+    
+    def _fetch_section(self, section: str, limit: Optional[int] = None,
+                       fixture_id: Optional[int] = None) -> Dict[str, Any]:
+        """Fetch and format one section from API-Football"""
+        if not self.is_available():
+            return {"error": "API-Football service not available", "available": False}
+        
+        request = self._section_request(section, limit, fixture_id)
+        if http_client.circuit_open(self.base_url):
+            return self._circuit_open_error()
+        delay = rapidapi_quota.reserve()
+        if delay is None:
+            return self._quota_refusal()
+        time.sleep(delay)
+        
+        headers, validator = self._conditional_headers(request)
+        try:
+            response = http_client.get(
+                f"{self.base_url}/{request['endpoint']}", headers=headers, params=request['params'], timeout=10
+            )
+            rapidapi_quota.record(response.status_code, response.headers)
+            return self._parse_response(request, validator, response.status_code, response.headers, response.content)
+            
+        except requests.exceptions.RequestException as e:
+            logger.error(f"API-Football request error: {str(e)}")
+            return {"error": f"Request failed: {str(e)}", "available": False}
+    
+    def get_comprehensive_current_data(self, deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get all current Chelsea data in one call
+        
+        The sections are fetched concurrently; whatever has not arrived within
+        deadline seconds is returned as timed out rather than awaited.
+        """
         if not self.is_available():
             return {
                 "available": False,
@@ -415,18 +663,16 @@ class FootballAPIService:
             }
         
         try:
-            # Get all current data
-            current_stats = self.get_current_season_stats()
-            recent_matches = self.get_recent_matches(3)
-            next_matches = self.get_next_matches(2)
-            league_position = self.get_league_standings()
+            # Fetch all sections concurrently under one deadline
+            sections, section_timings = self._fetch_sections(
+                self._current_data_sections(), COMPREHENSIVE_DEADLINE if deadline is None else deadline
+            )
             
             return {
                 "available": True,
-                "current_season": current_stats,
-                "recent_matches": recent_matches,
-                "upcoming_fixtures": next_matches,
-                "league_position": league_position,
+                **sections,
+                "data_staleness": self._summarize_staleness(sections),
+                "section_timings": section_timings,
                 "data_timestamp": datetime.now().isoformat()
             }
         except Exception as e:
@@ -434,4 +680,87 @@ class FootballAPIService:
             return {
                 "available": False,
                 "error": f"Failed to fetch current data: {str(e)}"
-            }
\ No newline at end of file
+            }
+    
+    def get_live_match(self) -> Optional[Dict[str, Any]]:
+        """The live match as last written by the live match tracker, or None outside a match"""
+        return api_football_cache.get(LIVE_MATCH_KEY.format(team_id=self.chelsea_team_id))
+    
+    def get_cached_current_data(self) -> Dict[str, Any]:
+        """
+        Same sections as get_comprehensive_current_data, read from the cache only
+        
+        Never calls API-Football; the live data poller keeps these entries
+        fresh. Sections not cached yet are reported unavailable. During a
+        match the live match, with its latest deltas, is included too.
+        """
+        if not self.is_available():
+            return {
+                "available": False,
+                "error": "API-Football service not available - API key not configured",
+                "note": "Using historical data only"
+            }
+        
+        sections = {}
+        for name, (fetch, args) in self._current_data_sections().items():
+            section = fetch.peek(self, *args)
+            sections[name] = section if section is not None else {
+                "error": "Not fetched yet", "available": False, "not_cached": True
+            }
+        
+        return {
+            "available": True,
+            **sections,
+            "live_match": self.get_live_match(),
+            "data_staleness": self._summarize_staleness(sections),
+            "data_timestamp": datetime.now().isoformat()
+        }
+    
+    def _current_data_sections(self) -> Dict[str, Tuple[Callable[..., Dict[str, Any]], tuple]]:
+        """Sections of the combined current data, as unbound cached getters and their arguments"""
+        return {
+            "current_season": (FootballAPIService.get_current_season_stats, ()),
+            "recent_matches": (FootballAPIService.get_recent_matches, (3,)),
+            "upcoming_fixtures": (FootballAPIService.get_next_matches, (2,)),
+            "league_position": (FootballAPIService.get_league_standings, ())
+        }
+    
+    def _fetch_sections(self, fetchers: Dict[str, Tuple[Callable[..., Dict[str, Any]], tuple]],
+                        deadline: float) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """
+        Run section getters on this client in parallel, returning what finished within the deadline
+        
+        Returns:
+            Tuple of sections by name and per-section timing; sections that
+            missed the deadline are reported unavailable with timed_out set
+        """
+        started = time.time()
+        
+        def timed(fetch: Callable[..., Dict[str, Any]], args: tuple) -> Tuple[Dict[str, Any], float]:
+            fetch_started = time.time()
+            result = fetch(self, *args)
+            return result, round(time.time() - fetch_started, 3)
+        
+        futures = {
+            name: _section_executor.submit(timed, fetch, args)
+            for name, (fetch, args) in fetchers.items()
+        }
+        wait(futures.values(), timeout=deadline)
+        
+        sections = {}
+        section_timings = {}
+        for name, future in futures.items():
+            if not future.done():
+                logger.warning(f"API-Football section {name} missed the {deadline}s deadline")
+                sections[name] = {"error": f"Timed out after {deadline}s", "available": False, "timed_out": True}
+                section_timings[name] = {"duration_seconds": round(time.time() - started, 3), "timed_out": True}
+                continue
+            
+            try:
+                sections[name], duration = future.result()
+            except Exception as e:
+                logger.error(f"API-Football section {name} failed: {str(e)}")
+                sections[name], duration = {"error": str(e), "available": False}, None
+            section_timings[name] = {"duration_seconds": duration, "timed_out": False}
+        
+        return sections, section_timings
@@ -24,10 +24,36 @@ except ImportError:
     sys.path.append(os.path.dirname(__file__))
     from football_api_service import FootballAPIService
 
+from services.cache_service import cached
+from services.http_client import http_client
+from services.live_data_poller import live_data_poller
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Answers to the suggested questions are historical, so they are reused for hours
+SUGGESTED_ANSWER_TTL = int(os.getenv('SUGGESTED_ANSWER_TTL', 6 * 3600))
+
+SUGGESTED_QUESTIONS = [
+    "When was Chelsea FC founded and by whom?",
+    "Tell me about Chelsea's Champions League victories",
+    "Who are Chelsea's greatest managers in history?",
+    "What is the history of Stamford Bridge stadium?",
+    "Who are the top goalscorers in Chelsea's history?",
+    "Tell me about the Roman Abramovich era at Chelsea",
+    "What trophies has Chelsea won?",
+    "Who were the key players in Chelsea's 2012 Champions League win?",
+    "What is the significance of 'KTBFFH' for Chelsea fans?",
+    "Tell me about Chelsea's academy and youth development"
+]
+
+def _mark_cached_answer(result: Dict, cache_info: Dict[str, Any]) -> Dict:
+    """Flag a suggested-question answer that was served from cache"""
+    if not cache_info['from_cache']:
+        return result
+    return {**result, 'metadata': {**result.get('metadata', {}), 'cached_answer': True}}
+
 class GeminiService:
     def __init__(self):
         self.api_key = os.getenv('GEMINI_API_KEY')
@@ -45,6 +71,9 @@ class GeminiService:
         
         # Initialize Football API service for real-time data
         self.football_api = FootballAPIService()
+        
+        # Staleness of the real-time data used for the last response
+        self.real_time_staleness: Optional[Dict[str, Any]] = None
     
     def _load_chelsea_context(self) -> str:
         """Load comprehensive Chelsea FC context for enhanced responses"""
@@ -114,8 +143,13 @@ class GeminiService:
             return "\n=== REAL-TIME DATA STATUS ===\nReal-time data unavailable (API-Football key needed for current season stats)\nUsing historical data only\n"
         
         try:
-            # Get comprehensive current data
-            current_data = self.football_api.get_comprehensive_current_data()
+            # The live data poller keeps current data cached, so chat never waits on API-Football
+            if live_data_poller.enabled:
+                current_data = self.football_api.get_cached_current_data()
+            else:
+                current_data = self.football_api.get_comprehensive_current_data()
+            
+            self.real_time_staleness = current_data.get("data_staleness")
             
             if not current_data.get("available", False):
                 return f"\n=== REAL-TIME DATA STATUS ===\nReal-time data unavailable: {current_data.get('error', 'Unknown error')}\nUsing historical data only\n"
@@ -123,6 +157,16 @@ class GeminiService:
             # Format real-time context
             context_parts = ["\n=== CURRENT SEASON REAL-TIME DATA ==="]
             
+            # Add the live match, kept current by the live match tracker
+            live_match = current_data.get("live_match")
+            if live_match and live_match.get("live"):
+                status = live_match.get("status", {})
+                minute = f"{status.get('elapsed')}'" if status.get("elapsed") is not None else status.get("long")
+                context_parts.append(f"LIVE NOW: {live_match.get('home')} {live_match.get('score')} {live_match.get('away')} ({minute}, {status.get('long')})")
+                key_events = [event for event in live_match.get("events", []) if event.get("type") in ("Goal", "Card")]
+                for event in key_events[-5:]:
+                    context_parts.append(f"- {event.get('minute')}' {event.get('detail')}: {event.get('player')} ({event.get('team')})")
+            
             # Add current season stats
             if current_data.get("current_season", {}).get("available"):
                 season_data = current_data["current_season"]
@@ -162,6 +206,11 @@ class GeminiService:
                     context_parts.append(f"- vs {opponent} ({home_away}) - {date}")
             
             context_parts.append(f"Data last updated: {current_data.get('data_timestamp', 'Unknown')}")
+            staleness = current_data.get("data_staleness") or {}
+            if staleness.get("any_degraded"):
+                context_parts.append(f"Note: live data provider is currently failing; some figures are up to {int(staleness.get('max_age_seconds', 0) // 60)} minutes old")
+            elif staleness.get("any_stale"):
+                context_parts.append(f"Note: some figures are up to {int(staleness.get('max_age_seconds', 0) // 60)} minutes old and are being refreshed")
             context_parts.append("=== END REAL-TIME DATA ===\n")
             
             return "\n".join(context_parts)
@@ -174,6 +223,10 @@ class GeminiService:
         """
         Generate AI response using Gemini AI with smart data routing
         
+        A suggested question asked without prior conversation is answered from
+        the shared cache, which the startup warm-up fills. While Gemini's
+        circuit breaker is open, only cached answers are given.
+        
         Args:
             user_message: User's question/message
             chat_history: Previous conversation context
@@ -181,6 +234,49 @@ class GeminiService:
         Returns:
             Dict with response data or error information
         """
+        suggested = not chat_history and user_message in SUGGESTED_QUESTIONS
+        
+        # While Gemini's circuit is open, answer from cache or fail fast instead of waiting out the timeout
+        if http_client.circuit_open(self.base_url):
+            if suggested:
+                cached_answer = self.answer_suggested_question.peek(self, SUGGESTED_QUESTIONS.index(user_message))
+                if cached_answer is not None:
+                    return cached_answer
+            return {
+                'success': False,
+                'error': 'Gemini API unavailable - circuit open',
+                'circuit_open': True,
+                'message': "The AI service is having problems right now. Please try again in a minute."
+            }
+        
+        if suggested:
+            return self.answer_suggested_question(SUGGESTED_QUESTIONS.index(user_message))
+        
+        return self._generate_response(user_message, chat_history)
+    
+    @cached(ttl=SUGGESTED_ANSWER_TTL, key="suggested_answer_{index}", stale_ttl=SUGGESTED_ANSWER_TTL,
+            cache_if=lambda result: result.get('success', False), annotate=_mark_cached_answer)
+    def answer_suggested_question(self, index: int) -> Dict:
+        """Answer one of the suggested questions, caching successful answers"""
+        return self._generate_response(SUGGESTED_QUESTIONS[index])
+    
+    def warm_suggested_answers(self) -> Dict[str, Any]:
+        """Make sure every suggested question has a cached answer"""
+        if not self.api_key:
+            return {'available': False, 'error': 'Gemini API key not configured'}
+        
+        answered = sum(
+            1 for index in range(len(SUGGESTED_QUESTIONS))
+            if self.answer_suggested_question(index).get('success', False)
+        )
+        return {
+            'available': answered == len(SUGGESTED_QUESTIONS),
+            'answered': answered,
+            'total': len(SUGGESTED_QUESTIONS)
+        }
+    
+    def _generate_response(self, user_message: str, chat_history: Optional[List[Dict]] = None) -> Dict:
+        """Call Gemini for a response, adding real-time context when the query needs it"""
         if not self.api_key:
             logger.error("Attempted to generate response without API key")
             return {
@@ -227,7 +323,7 @@ class GeminiService:
                 'x-goog-api-key': self.api_key
             }
             
-            response = requests.post(
+            response = http_client.post(
                 self.base_url,
                 headers=headers,
                 json=payload,
@@ -256,6 +352,7 @@ class GeminiService:
                                 'validation': validation,
                                 'query_classification': query_classification,
                                 'used_real_time_data': bool(real_time_context),
+                                'real_time_staleness': self.real_time_staleness,
                                 'api_football_available': self.football_api.is_available()
                             }
                         }
@@ -340,18 +437,7 @@ class GeminiService:
     
     def get_suggested_questions(self) -> List[str]:
         """Return a list of suggested questions about Chelsea FC"""
-        return [
-            "When was Chelsea FC founded and by whom?",
-            "Tell me about Chelsea's Champions League victories",
-            "Who are Chelsea's greatest managers in history?",
-            "What is the history of Stamford Bridge stadium?",
-            "Who are the top goalscorers in Chelsea's history?",
-            "Tell me about the Roman Abramovich era at Chelsea",
-            "What trophies has Chelsea won?",
-            "Who were the key players in Chelsea's 2012 Champions League win?",
-            "What is the significance of 'KTBFFH' for Chelsea fans?",
-            "Tell me about Chelsea's academy and youth development"
-        ]
+        return list(SUGGESTED_QUESTIONS)
     
     def _validate_response(self, user_message: str, ai_response: str) -> Dict:
         """Validate AI response for factual accuracy"""
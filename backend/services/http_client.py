@@ -0,0 +1,167 @@
+"""
+Shared HTTP client for Blue's Book upstream APIs
+Pools keep-alive connections per host, retries idempotent GETs with backoff
+and fails fast while a host's circuit breaker is open
+"""
+
+import os
+import threading
+import logging
+from typing import Dict, Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import Config
+from services.circuit_breaker import CircuitBreakerRegistry, CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+
+def parse_pool_sizes(spec: str) -> Dict[str, int]:
+    """Parse 'host=size,host=size' into a dict, skipping malformed pairs"""
+    sizes = {}
+    for pair in filter(None, (part.strip() for part in spec.split(','))):
+        host, _, size = pair.partition('=')
+        try:
+            sizes[host.strip()] = int(size)
+        except ValueError:
+            logger.warning(f"Ignoring invalid HTTP pool size: {pair}")
+    return sizes
+
+
+class HttpClient:
+    """
+    Per-process requests.Session with pooled connections
+
+    Each configured host gets its own connection pool; other hosts share a
+    default-sized one. GETs are retried on connection errors and the
+    configured statuses with exponential backoff, but not on read timeouts:
+    each retry would wait out the full timeout again, holding the caller
+    well past its deadline. Other methods are only retried when the
+    connection could not be established, since the request was then never
+    sent.
+
+    A request that still fails after retries (connection error, timeout or
+    5xx) counts against its host's circuit breaker; while the circuit is open,
+    requests raise CircuitOpenError without being sent.
+    """
+
+    def __init__(self, default_pool_size: int = 10, pool_sizes: Optional[Dict[str, int]] = None,
+                 retries: int = 2, backoff_factor: float = 0.5,
+                 retry_statuses: tuple = (500, 502, 503, 504),
+                 breakers: Optional[CircuitBreakerRegistry] = None):
+        """
+        Initialize HTTP client
+
+        Args:
+            default_pool_size: Connections kept per host not listed in pool_sizes
+            pool_sizes: Connections kept for specific hosts, e.g. {'api-football-v1.p.rapidapi.com': 16}
+            retries: Retries for a failed idempotent request (0 disables)
+            backoff_factor: Base delay in seconds, doubling with each retry
+            retry_statuses: Response statuses that trigger a retry of a GET
+            breakers: Per-host circuit breakers (a default registry if omitted)
+        """
+        self.default_pool_size = default_pool_size
+        self.pool_sizes = pool_sizes or {}
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.retry_statuses = retry_statuses
+        self.breakers = breakers or CircuitBreakerRegistry()
+        self._session: Optional[requests.Session] = None
+        self._session_pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """The session for this process; pooled sockets must not be shared across fork"""
+        if self._session_pid != os.getpid():
+            with self._lock:
+                if self._session_pid != os.getpid():
+                    self._session = self._build_session()
+                    self._session_pid = os.getpid()
+        return self._session
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a GET through the pooled session"""
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a POST through the pooled session"""
+        return self.request('POST', url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request unless the host's circuit is open, recording the outcome"""
+        if not self.breakers.allow_request(url):
+            breaker = self.breakers.for_url(url)
+            raise CircuitOpenError(f"Circuit open for {breaker.name}, retry in {breaker.retry_in()}s")
+
+        breaker = self.breakers.for_url(url)
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except Exception:
+            # Any error counts, or a failed half-open trial would leave the host refused for good
+            breaker.record_failure()
+            raise
+        except BaseException:
+            # Interrupted with no outcome; free the half-open trial for the next caller
+            breaker.release()
+            raise
+
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    def circuit_open(self, url: str) -> bool:
+        """Whether requests to url's host are currently refused"""
+        return self.breakers.is_open(url)
+
+    def _build_session(self) -> requests.Session:
+        """Create a session with one adapter per configured host"""
+        session = requests.Session()
+        session.mount('https://', self._build_adapter(self.default_pool_size))
+        session.mount('http://', self._build_adapter(self.default_pool_size))
+
+        for host, size in self.pool_sizes.items():
+            adapter = self._build_adapter(size)
+            session.mount(f"https://{host}", adapter)
+            session.mount(f"http://{host}", adapter)
+
+        logger.info(f"HTTP client pool ready (default {self.default_pool_size}, per host {self.pool_sizes})")
+        return session
+
+    def _build_adapter(self, pool_size: int) -> HTTPAdapter:
+        """Adapter with keep-alive pooling and the GET retry policy"""
+        retry = Retry(
+            total=self.retries,
+            connect=self.retries,
+            # A read timeout already cost a full timeout; fail instead of waiting again
+            read=False,
+            status=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.retry_statuses,
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            respect_retry_after_header=True,
+            # Hand the last response back so callers keep handling status codes themselves
+            raise_on_status=False
+        )
+        # pool_connections is how many per-host pools an adapter keeps; pool_maxsize is sockets per host
+        return HTTPAdapter(pool_connections=10, pool_maxsize=pool_size, max_retries=retry)
+
+
+# Global HTTP client shared by the upstream API services
+http_client = HttpClient(
+    default_pool_size=Config.HTTP_POOL_SIZE,
+    pool_sizes=parse_pool_sizes(Config.HTTP_POOL_SIZES),
+    retries=Config.HTTP_RETRIES,
+    backoff_factor=Config.HTTP_RETRY_BACKOFF,
+    retry_statuses=tuple(int(status) for status in Config.HTTP_RETRY_STATUSES.split(',') if status.strip()),
+    breakers=CircuitBreakerRegistry(
+        failure_threshold=Config.CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout=Config.CIRCUIT_RESET_TIMEOUT,
+        enabled=Config.CIRCUIT_BREAKER_ENABLED
+    )
+)
@@ -0,0 +1,230 @@
+"""
+Live data poller for Blue's Book
+Keeps Chelsea's current-season sections in the cache from a background thread,
+so chat requests read real-time data without waiting on API-Football
+"""
+
+import os
+import threading
+import time
+import logging
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from config import Config
+
+try:
+    import fcntl
+except ImportError:  # Windows: no file locking, every worker polls
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Shortest pause between loop passes, so an overdue wake time can't turn the loop into a busy spin
+MIN_SLEEP_SECONDS = 0.5
+
+
+class LiveDataPoller:
+    """
+    Refreshes season stats, fixtures and standings on a schedule
+
+    Each cycle runs the combined current-data fetch, whose cached getters only
+    go upstream for sections whose fixture-aware TTL has run out. During a
+    Chelsea match the live match tracker also runs, as often as the RapidAPI
+    quota allows. When the cache is shared, one worker polls: the holder of a
+    Redis lock (one poller for all hosts) or of a file lock (one per host). A
+    worker that loses or never gets the lock keeps trying, so polling moves on
+    if the holder dies.
+
+    Live polls spend quota every few seconds, so they always need a lock: with
+    lock 'none' (each worker polling its own memory cache) the file lock still
+    picks one live tracker per host, and only that worker's cache sees the
+    live match.
+    """
+
+    def __init__(self, enabled: bool = True, interval: float = 60, lock: str = 'auto',
+                 lock_path: Optional[str] = None, lock_name: str = 'bluesbook:live-poller'):
+        """
+        Initialize live data poller
+
+        Args:
+            enabled: When False, callers fetch current data themselves
+            interval: Seconds between polling cycles
+            lock: 'redis', 'file', 'none', or 'auto' (redis for a shared cache, none for a per-worker one)
+            lock_path: Lock file used by the 'file' lock
+            lock_name: Redis key used by the 'redis' lock
+        """
+        self.enabled = enabled
+        self.interval = interval
+        self.lock = lock
+        self.lock_path = lock_path
+        self.lock_name = lock_name
+        self.is_leader = False
+        self.is_live_leader = False
+        self.cycles = 0
+        self.last_cycle_at: Optional[float] = None
+        self.last_cycle_seconds: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._lock_handle: Any = None
+        self._pid: Optional[int] = None
+        self._start_lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start polling in a background thread, once per process (threads do not survive fork)"""
+        if not self.enabled:
+            return
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self.is_leader = False
+            self.is_live_leader = False
+            self._lock_handle = None
+
+        threading.Thread(target=self._run, name="live-data-poller", daemon=True).start()
+
+    def poll_once(self) -> Dict[str, Any]:
+        """Run one refresh cycle and return the combined current data"""
+        # Imported here so the service (and its cache) loads in the worker, not at import time
+        from services.football_api_service import FootballAPIService
+
+        started = time.time()
+        current_data = FootballAPIService().get_comprehensive_current_data()
+        self.cycles += 1
+        self.last_cycle_at = started
+        self.last_cycle_seconds = round(time.time() - started, 3)
+        self.last_error = None if current_data.get('available') else current_data.get('error')
+        return current_data
+
+    def get_status(self) -> Dict[str, Any]:
+        """Polling state for the health endpoint"""
+        from services.live_match_service import live_match_tracker
+
+        return {
+            'enabled': self.enabled,
+            'lock': self._lock_mode(),
+            'leader': self.is_leader,
+            'live_leader': self.is_live_leader,
+            'interval_seconds': self.interval,
+            'cycles': self.cycles,
+            'last_cycle_at': datetime.fromtimestamp(self.last_cycle_at).isoformat() if self.last_cycle_at else None,
+            'last_cycle_seconds': self.last_cycle_seconds,
+            'last_error': self.last_error,
+            'live_match': live_match_tracker.get_status()
+        }
+
+    def _run(self) -> None:
+        """Poll every interval while holding leadership, and the live match at its paced interval during one"""
+        next_cycle_at = 0.0
+        next_live_at: Optional[float] = None
+        while True:
+            try:
+                if self._hold_leadership():
+                    if time.time() >= next_cycle_at:
+                        next_cycle_at = time.time() + self.interval
+                        self.poll_once()
+                else:
+                    next_cycle_at = time.time() + self.interval
+                next_live_at = self._poll_live_match(next_live_at)
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error(f"Live data poll failed: {str(e)}")
+
+            wake_at = next_cycle_at if next_live_at is None else min(next_cycle_at, next_live_at)
+            time.sleep(max(MIN_SLEEP_SECONDS, wake_at - time.time()))
+
+    def _poll_live_match(self, next_live_at: Optional[float]) -> Optional[float]:
+        """Poll the live fixture when due, returning when to poll it next (None outside a match)"""
+        from services.live_match_service import live_match_tracker
+
+        if not live_match_tracker.is_active() or not self._hold_live_leadership():
+            return None
+        if next_live_at is not None and time.time() < next_live_at:
+            return next_live_at
+
+        pace = live_match_tracker.pace()
+        if pace is None:
+            # The quota share for live polling is spent; sections keep their normal schedule
+            return time.time() + self.interval
+        next_live_at = time.time() + pace
+        live_match_tracker.poll_once()
+        return next_live_at
+
+    def _lock_mode(self) -> str:
+        """Resolve 'auto' from the cache backend in use"""
+        if self.lock != 'auto':
+            return self.lock
+        from services.cache_service import api_football_cache, RedisCacheService, TieredCacheService
+        # A per-worker memory cache is only filled by that worker's own poller
+        return 'redis' if isinstance(api_football_cache, (RedisCacheService, TieredCacheService)) else 'none'
+
+    def _hold_leadership(self) -> bool:
+        """Acquire the poller lock, or renew it if already held"""
+        mode = self._lock_mode()
+        if mode == 'redis':
+            was_leader = self.is_leader
+            self.is_leader = self._hold_redis_lock()
+        elif mode == 'file':
+            was_leader = self.is_leader
+            self.is_leader = self._hold_file_lock()
+        else:
+            was_leader, self.is_leader = True, True
+
+        if self.is_leader != was_leader:
+            logger.info(f"Live data poller {'acquired' if self.is_leader else 'lost'} the {mode} lock")
+        return self.is_leader
+
+    def _hold_live_leadership(self) -> bool:
+        """The poller lock, or the file lock when sections are polled per worker"""
+        if self._lock_mode() != 'none':
+            self.is_live_leader = self.is_leader
+        else:
+            was_leader = self.is_live_leader
+            self.is_live_leader = self._hold_file_lock()
+            if self.is_live_leader and not was_leader:
+                logger.info("Live data poller acquired the file lock for live match tracking")
+        return self.is_live_leader
+
+    def _hold_redis_lock(self) -> bool:
+        """Hold a Redis lock that expires if this worker stops renewing it"""
+        from services.cache_service import api_football_cache, TieredCacheService
+
+        if self._lock_handle is None:
+            cache = api_football_cache.l2 if isinstance(api_football_cache, TieredCacheService) else api_football_cache
+            self._lock_handle = cache.client.lock(self.lock_name, timeout=self.interval * 3)
+
+        if self.is_leader:
+            try:
+                self._lock_handle.reacquire()
+                return True
+            except Exception:
+                # Expired (e.g. a long pause) and possibly taken by another worker; try again below
+                pass
+        return bool(self._lock_handle.acquire(blocking=False))
+
+    def _hold_file_lock(self) -> bool:
+        """Hold an exclusive lock on the lock file for as long as the process lives"""
+        if self._lock_handle is not None:
+            return True
+        if fcntl is None:
+            return True
+
+        lock_file = open(self.lock_path, 'a')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+
+        # The lock lasts as long as the file stays open
+        self._lock_handle = lock_file
+        return True
+
+
+# Global live data poller instance
+live_data_poller = LiveDataPoller(
+    enabled=Config.LIVE_POLLER_ENABLED,
+    interval=Config.LIVE_POLLER_INTERVAL,
+    lock=Config.LIVE_POLLER_LOCK,
+    lock_path=Config.LIVE_POLLER_LOCK_PATH
+)
@@ -0,0 +1,203 @@
+"""
+Live match tracker for Blue's Book
+Polls the live fixture every few seconds during a Chelsea match and writes
+the score, status and new events into the cache, so chat and API reads see
+the current state without calling API-Football themselves
+"""
+
+import time
+import logging
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple
+
+from config import Config
+
+try:
+    from .cache_service import api_football_cache
+    from .football_api_service import FootballAPIService, LIVE_MATCH_KEY, fixture_calendar
+    from .rapidapi_quota import rapidapi_quota
+except ImportError:
+    from services.cache_service import api_football_cache
+    from services.football_api_service import FootballAPIService, LIVE_MATCH_KEY, fixture_calendar
+    from services.rapidapi_quota import rapidapi_quota
+
+logger = logging.getLogger(__name__)
+
+# API-Football statuses after which a fixture will not change any more
+FINISHED_STATUSES = {'FT', 'AET', 'PEN', 'PST', 'CANC', 'ABD', 'AWD', 'WO'}
+
+
+def _event_identity(event: Dict[str, Any]) -> Tuple:
+    """Fields that identify an event across polls"""
+    return (event.get('minute'), event.get('extra'), event.get('team'),
+            event.get('player'), event.get('type'), event.get('detail'))
+
+
+def compute_deltas(previous: Optional[Dict[str, Any]], current: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Changes between two polls of the same fixture
+
+    Returns status changes, score changes and events (goals, cards,
+    substitutions, VAR decisions) not present in the previous poll. With no
+    previous poll, every event so far is new.
+    """
+    previous = previous or {}
+    deltas = []
+
+    previous_status = (previous.get('status') or {}).get('short')
+    if current['status']['short'] != previous_status:
+        deltas.append({
+            'type': 'status',
+            'from': previous_status,
+            'to': current['status']['short'],
+            'description': current['status']['long']
+        })
+
+    if previous.get('score') is not None and current['score'] != previous['score']:
+        deltas.append({'type': 'score', 'from': previous['score'], 'to': current['score']})
+
+    seen = Counter(_event_identity(event) for event in previous.get('events', []))
+    for event in current['events']:
+        identity = _event_identity(event)
+        if seen[identity]:
+            seen[identity] -= 1
+            continue
+        deltas.append({**event, 'type': (event.get('type') or 'event').lower(), 'event_type': event.get('type')})
+
+    return deltas
+
+
+class LiveMatchTracker:
+    """
+    High-frequency polling of the fixture that is currently live
+
+    The match is found from the fixture calendar, which learns kickoffs and
+    fixture ids from get_next_matches; polling starts at kickoff. The cached
+    entry is replaced on every poll with the latest state plus a bounded,
+    sequence-numbered delta log, so readers can ask for what changed since the
+    last sequence they saw. At full time the fixture is marked finished and
+    fixtures and results are invalidated.
+
+    Polls are paced by the RapidAPI quota: interval is the fastest rate, and
+    it is stretched so the rest of the match costs at most quota_share of the
+    requests left above the reserve.
+    """
+
+    def __init__(self, enabled: bool = True, interval: float = 5, cache_ttl: float = 900,
+                 max_deltas: int = 50, quota_share: float = 0.5):
+        """
+        Initialize live match tracker
+
+        Args:
+            enabled: When False, no live polling happens
+            interval: Shortest time in seconds between polls of the live fixture
+            cache_ttl: How long the last written state stays readable once polling stops
+            max_deltas: Deltas kept in the cached entry
+            quota_share: Share of the remaining RapidAPI quota (above the reserve) live polling may spend
+        """
+        self.enabled = enabled
+        self.interval = interval
+        self.cache_ttl = cache_ttl
+        self.max_deltas = max_deltas
+        self.quota_share = quota_share
+        self.paced_interval: Optional[float] = None
+        self.polls = 0
+        self.last_poll_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    def is_active(self) -> bool:
+        """Whether a tracked Chelsea fixture has kicked off and its live window is still open"""
+        live = fixture_calendar.live_fixture() if self.enabled else None
+        return live is not None and time.time() >= live[0]
+
+    def pace(self) -> Optional[float]:
+        """
+        Seconds to wait before the next poll
+
+        Spreads quota_share of the requests left above the RapidAPI reserve
+        over the rest of the live window, never polling faster than interval.
+        None when that share is used up (or no match is live).
+        """
+        live = fixture_calendar.live_fixture() if self.enabled else None
+        if live is None:
+            self.paced_interval = None
+            return None
+
+        window_left = live[0] + fixture_calendar.live_seconds - time.time()
+        quota = rapidapi_quota.get_status()
+        budget = (quota['remaining'] - quota['reserve']) * self.quota_share
+        if budget < 1:
+            self.paced_interval = None
+            return None
+
+        self.paced_interval = round(max(self.interval, window_left / budget), 1)
+        return self.paced_interval
+
+    def poll_once(self) -> List[Dict[str, Any]]:
+        """Fetch the live fixture, write its new state to the cache and return the deltas"""
+        live = fixture_calendar.live_fixture() if self.enabled else None
+        if live is None:
+            return []
+        kickoff, fixture_id = live
+
+        football = FootballAPIService()
+        current = football._fetch_section('live_match', fixture_id=fixture_id)
+        self.polls += 1
+        self.last_poll_at = time.time()
+        if not current.get('available'):
+            self.last_error = current.get('error')
+            return []
+        self.last_error = None
+
+        key = LIVE_MATCH_KEY.format(team_id=football.chelsea_team_id)
+        previous = api_football_cache.get(key)
+        if previous is not None and previous.get('fixture_id') != fixture_id:
+            previous = None
+
+        seq = previous['seq'] if previous else 0
+        deltas = []
+        for delta in compute_deltas(previous, current):
+            seq += 1
+            deltas.append({**delta, 'seq': seq, 'at': datetime.now().isoformat()})
+
+        api_football_cache.set(key, {
+            **current,
+            'live': current['status']['short'] not in FINISHED_STATUSES,
+            'seq': seq,
+            'deltas': ((previous or {}).get('deltas', []) + deltas)[-self.max_deltas:],
+            'polled_at': datetime.now().isoformat()
+        }, ttl=self.cache_ttl)
+
+        for delta in deltas:
+            logger.info(f"Live match {fixture_id}: {delta['type']} {delta.get('to') or delta.get('detail') or ''}".rstrip())
+
+        if current['status']['short'] in FINISHED_STATUSES:
+            # Full time: stop live polling and refresh everything the result changes right away
+            fixture_calendar.mark_finished([kickoff])
+            football.invalidate_after_match()
+
+        return deltas
+
+    def get_status(self) -> Dict[str, Any]:
+        """Tracking state for the health endpoint"""
+        live = fixture_calendar.live_fixture() if self.enabled else None
+        return {
+            'enabled': self.enabled,
+            'active': live is not None,
+            'fixture_id': live[1] if live else None,
+            'interval_seconds': self.interval,
+            'paced_interval_seconds': self.paced_interval,
+            'polls': self.polls,
+            'last_poll_at': datetime.fromtimestamp(self.last_poll_at).isoformat() if self.last_poll_at else None,
+            'last_error': self.last_error
+        }
+
+
+# Global live match tracker, driven by the live data poller
+live_match_tracker = LiveMatchTracker(
+    enabled=Config.LIVE_MATCH_ENABLED,
+    interval=Config.LIVE_MATCH_POLL_INTERVAL,
+    cache_ttl=Config.LIVE_MATCH_CACHE_TTL,
+    quota_share=Config.LIVE_MATCH_QUOTA_SHARE
+)
@@ -0,0 +1,213 @@
+"""
+RapidAPI quota guard for Blue's Book
+Rate-limits API-Football calls with a token bucket and tracks the plan's daily
+request quota, switching to cache-only mode before it runs out
+"""
+
+import json
+import threading
+import time
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional, Callable, Mapping
+
+from config import Config
+
+try:
+    import fcntl
+except ImportError:  # Windows: state is still persisted, without cross-process locking
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+def _next_utc_midnight(current_time: float) -> float:
+    """RapidAPI daily quotas reset at midnight UTC"""
+    today = datetime.fromtimestamp(current_time, timezone.utc).date()
+    return datetime.combine(today + timedelta(days=1), datetime.min.time(), timezone.utc).timestamp()
+
+
+def _header_int(headers: Mapping[str, str], name: str) -> Optional[int]:
+    """Read an integer rate-limit header, if present"""
+    value = headers.get(name)
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class RapidAPIQuota:
+    """
+    Token bucket and daily budget shared by every API-Football client
+
+    The state lives in a small JSON file guarded by a file lock, so all
+    workers on a host draw from one bucket and one daily count. Remaining
+    quota is taken from RapidAPI's rate-limit headers when a response carries
+    them, and counted locally in between.
+    """
+
+    def __init__(self, daily_limit: int, reserve: int = 0, rate_per_minute: float = 30,
+                 burst: int = 10, max_wait: float = 5, state_path: Optional[str] = None):
+        """
+        Initialize quota guard
+
+        Args:
+            daily_limit: Requests per day on the RapidAPI plan (until headers report it)
+            reserve: Remaining requests at which clients switch to cache-only mode
+            rate_per_minute: Sustained request rate of the token bucket
+            burst: Requests that may be sent back to back
+            max_wait: Longest a request waits for a token before it is refused
+            state_path: JSON file shared by workers; None keeps state in this process
+        """
+        self.daily_limit = daily_limit
+        self.reserve_threshold = reserve
+        self.rate_per_second = rate_per_minute / 60
+        self.burst = burst
+        self.max_wait = max_wait
+        self.state_path = state_path or None
+        self._state: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self) -> Optional[float]:
+        """
+        Claim a request slot
+
+        Returns:
+            Seconds to wait before sending, or None if the request must not be
+            sent (cache-only mode, or no token within max_wait)
+        """
+        def claim(state: Dict[str, Any], current_time: float) -> Optional[float]:
+            if self._remaining(state) <= self.reserve_threshold:
+                state['refused'] += 1
+                return None
+
+            tokens = min(self.burst, state['tokens'] + (current_time - state['refilled_at']) * self.rate_per_second)
+            delay = max(0.0, (1 - tokens) / self.rate_per_second)
+            if delay > self.max_wait:
+                state['throttled'] += 1
+                return None
+
+            # Tokens may go negative: later callers queue behind this reservation
+            state['tokens'] = tokens - 1
+            state['refilled_at'] = current_time
+            state['used'] += 1
+            state['used_since_report'] += 1
+            return delay
+
+        return self._update(claim)
+
+    def record(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Take remaining quota from a response's RapidAPI rate-limit headers"""
+        def update(state: Dict[str, Any], current_time: float) -> None:
+            remaining = _header_int(headers, 'x-ratelimit-requests-remaining')
+            if remaining is not None:
+                state['reported_remaining'] = remaining
+                state['used_since_report'] = 0
+            limit = _header_int(headers, 'x-ratelimit-requests-limit')
+            if limit is not None:
+                state['reported_limit'] = limit
+            reset = _header_int(headers, 'x-ratelimit-requests-reset')
+            if reset is not None:
+                state['period_ends_at'] = current_time + reset
+
+            minute_remaining = _header_int(headers, 'x-ratelimit-remaining')
+            if minute_remaining is not None:
+                state['minute_remaining'] = minute_remaining
+            if status_code == 429 or minute_remaining == 0:
+                # Upstream says this minute is used up; stop sending until the bucket refills
+                state['tokens'] = min(state['tokens'], 0)
+                state['refilled_at'] = current_time
+
+        self._update(update)
+
+    def is_cache_only(self) -> bool:
+        """Whether remaining quota is at or below the reserve"""
+        return self._update(lambda state, current_time: self._remaining(state) <= self.reserve_threshold)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Remaining quota and limiter counters for the metrics endpoint"""
+        def status(state: Dict[str, Any], current_time: float) -> Dict[str, Any]:
+            return {
+                'limit': state['reported_limit'] or self.daily_limit,
+                'remaining': self._remaining(state),
+                'remaining_source': 'headers' if state['reported_remaining'] is not None else 'local_count',
+                'used': state['used'],
+                'reserve': self.reserve_threshold,
+                'cache_only': self._remaining(state) <= self.reserve_threshold,
+                'resets_at': datetime.fromtimestamp(state['period_ends_at'], timezone.utc).isoformat(),
+                'minute_remaining': state['minute_remaining'],
+                'tokens': round(min(self.burst, state['tokens'] + (current_time - state['refilled_at']) * self.rate_per_second), 2),
+                'refused': state['refused'],
+                'throttled': state['throttled']
+            }
+
+        return self._update(status)
+
+    def _remaining(self, state: Dict[str, Any]) -> int:
+        """Requests left today: the last reported figure less what was sent since"""
+        if state['reported_remaining'] is not None:
+            return state['reported_remaining'] - state['used_since_report']
+        return (state['reported_limit'] or self.daily_limit) - state['used']
+
+    def _new_state(self, current_time: float) -> Dict[str, Any]:
+        """State for a fresh quota period with a full bucket"""
+        return {
+            'period_ends_at': _next_utc_midnight(current_time),
+            'used': 0,
+            'used_since_report': 0,
+            'reported_remaining': None,
+            'reported_limit': None,
+            'minute_remaining': None,
+            'tokens': self.burst,
+            'refilled_at': current_time,
+            'refused': 0,
+            'throttled': 0
+        }
+
+    def _update(self, mutate: Callable[[Dict[str, Any], float], Any]) -> Any:
+        """Load the state under lock, roll over the period if it ended, apply mutate and save"""
+        with self._lock:
+            if not self.state_path:
+                return self._apply(self._state, mutate)
+
+            try:
+                with open(self.state_path, 'a+') as state_file:
+                    if fcntl:
+                        fcntl.flock(state_file, fcntl.LOCK_EX)
+                    state_file.seek(0)
+                    try:
+                        state = json.loads(state_file.read() or '{}')
+                    except ValueError:
+                        logger.warning(f"Discarding unreadable quota state {self.state_path}")
+                        state = {}
+
+                    result = self._apply(state, mutate)
+
+                    state_file.seek(0)
+                    state_file.truncate()
+                    json.dump(state, state_file)
+                    return result
+            except OSError as e:
+                logger.error(f"Quota state {self.state_path} unavailable, tracking in memory: {str(e)}")
+                return self._apply(self._state, mutate)
+
+    def _apply(self, state: Dict[str, Any], mutate: Callable[[Dict[str, Any], float], Any]) -> Any:
+        """Reset an ended or missing period in place, then apply mutate"""
+        current_time = time.time()
+        if current_time >= state.get('period_ends_at', 0):
+            if state:
+                logger.info(f"RapidAPI quota period ended with {state.get('used', 0)} requests used")
+            state.clear()
+            state.update(self._new_state(current_time))
+        return mutate(state, current_time)
+
+
+# Global quota guard shared by the API-Football clients
+rapidapi_quota = RapidAPIQuota(
+    daily_limit=Config.RAPIDAPI_DAILY_QUOTA,
+    reserve=Config.RAPIDAPI_QUOTA_RESERVE,
+    rate_per_minute=Config.RAPIDAPI_RATE_PER_MINUTE,
+    burst=Config.RAPIDAPI_BURST,
+    max_wait=Config.RAPIDAPI_MAX_WAIT,
+    state_path=Config.RAPIDAPI_QUOTA_STATE_PATH
+)
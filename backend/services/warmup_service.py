@@ -0,0 +1,178 @@
+"""
+Cache warm-up service for Blue's Book
+Prefetches the keys listed in the warm-up manifest so a worker only reports
+ready once its cache is warm
+"""
+
+import json
+import os
+import threading
+import time
+import logging
+from datetime import datetime
+from typing import Dict, Any, Optional, Callable, List, Tuple
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Used when the manifest file is missing or unreadable
+DEFAULT_MANIFEST = {
+    'items': [
+        {'name': 'current_season_stats'},
+        {'name': 'league_standings'},
+        {'name': 'next_matches', 'kwargs': {'limit': 3}},
+        {'name': 'comprehensive_current_data'},
+        {'name': 'suggested_question_answers'}
+    ]
+}
+
+
+def _warmup_targets() -> Dict[str, Tuple[Callable[[], bool], Callable[..., Any]]]:
+    """Map manifest item names to (is_configured, loader) pairs"""
+    # Imported here so the services (and their caches) load in the worker, not at import time
+    from services.football_api_service import FootballAPIService
+    from services.gemini_service import GeminiService
+
+    football = FootballAPIService()
+    gemini = GeminiService()
+
+    return {
+        'current_season_stats': (football.is_available, football.get_current_season_stats),
+        'recent_matches': (football.is_available, football.get_recent_matches),
+        'next_matches': (football.is_available, football.get_next_matches),
+        'league_standings': (football.is_available, football.get_league_standings),
+        'squad_stats': (football.is_available, football.get_current_squad_stats),
+        'comprehensive_current_data': (football.is_available, football.get_comprehensive_current_data),
+        'suggested_question_answers': (lambda: bool(gemini.api_key), gemini.warm_suggested_answers)
+    }
+
+
+class WarmupService:
+    """Runs the warm-up manifest once per worker process and tracks readiness"""
+
+    def __init__(self, manifest_path: str, enabled: bool = True, timeout: float = 60):
+        """
+        Initialize warm-up service
+
+        Args:
+            manifest_path: JSON file listing the items to prefetch
+            enabled: When False the worker is ready immediately
+            timeout: Seconds after which the worker reports ready even if warm-up is unfinished
+        """
+        self.manifest_path = manifest_path
+        self.enabled = enabled
+        self.timeout = timeout
+        self.status = 'pending'
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+
+    def start(self) -> None:
+        """Start warming in a background thread, once per process (threads do not survive fork)"""
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self.started_at = time.time()
+
+            if not self.enabled:
+                self.status = 'disabled'
+                self.finished_at = self.started_at
+                return
+
+            self.status = 'warming'
+
+        threading.Thread(target=self.run, name="cache-warmup", daemon=True).start()
+
+    def run(self) -> None:
+        """Prefetch every manifest item, recording the outcome of each"""
+        try:
+            targets = _warmup_targets()
+        except Exception as e:
+            logger.error(f"Cache warm-up could not initialize services: {str(e)}")
+            self._finish('failed')
+            return
+
+        for item in self.load_manifest():
+            name = item.get('name')
+            kwargs = item.get('kwargs', {})
+            started = time.time()
+
+            if name not in targets:
+                outcome = {'status': 'failed', 'error': 'Unknown warm-up item'}
+            else:
+                is_configured, loader = targets[name]
+                outcome = self._warm_item(is_configured, loader, kwargs)
+
+            outcome['duration_seconds'] = round(time.time() - started, 3)
+            with self._lock:
+                self.items[name] = outcome
+            logger.info(f"Cache warm-up {name}: {outcome['status']} in {outcome['duration_seconds']}s")
+
+        failed = any(outcome['status'] == 'failed' for outcome in self.items.values())
+        self._finish('completed_with_errors' if failed else 'completed')
+
+    def load_manifest(self) -> List[Dict[str, Any]]:
+        """Read the manifest items, falling back to the default manifest"""
+        try:
+            with open(self.manifest_path) as manifest_file:
+                return json.load(manifest_file)['items']
+        except FileNotFoundError:
+            logger.warning(f"Warm-up manifest {self.manifest_path} not found, using defaults")
+        except (ValueError, KeyError) as e:
+            logger.error(f"Invalid warm-up manifest {self.manifest_path}, using defaults: {str(e)}")
+        return DEFAULT_MANIFEST['items']
+
+    def is_ready(self) -> bool:
+        """Ready once warm-up has finished, been disabled or run past its timeout"""
+        if self.finished_at is not None:
+            return True
+        return self.started_at is not None and time.time() - self.started_at > self.timeout
+
+    def get_status(self) -> Dict[str, Any]:
+        """Readiness with per-item warm-up results"""
+        with self._lock:
+            items = {name: dict(outcome) for name, outcome in self.items.items()}
+        end = self.finished_at or time.time()
+        return {
+            'ready': self.is_ready(),
+            'status': self.status,
+            'started_at': datetime.fromtimestamp(self.started_at).isoformat() if self.started_at else None,
+            'elapsed_seconds': round(end - self.started_at, 3) if self.started_at else None,
+            'timed_out': self.finished_at is None and self.is_ready(),
+            'items': items
+        }
+
+    @staticmethod
+    def _warm_item(is_configured: Callable[[], bool], loader: Callable[..., Any],
+                   kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one loader; results with available or success False count as failures"""
+        if not is_configured():
+            return {'status': 'skipped', 'error': 'Service not configured'}
+
+        try:
+            result = loader(**kwargs)
+        except Exception as e:
+            return {'status': 'failed', 'error': str(e)}
+
+        if isinstance(result, dict) and (result.get('available') is False or result.get('success') is False):
+            return {'status': 'failed', 'error': result.get('error', 'Unavailable')}
+        return {'status': 'warmed'}
+
+    def _finish(self, status: str) -> None:
+        """Record the final status and mark the worker ready"""
+        with self._lock:
+            self.status = status
+            self.finished_at = time.time()
+        logger.info(f"Cache warm-up {status} in {round(self.finished_at - self.started_at, 3)}s")
+
+
+# Global warm-up service instance
+warmup_service = WarmupService(
+    manifest_path=Config.CACHE_WARMUP_MANIFEST,
+    enabled=Config.CACHE_WARMUP_ENABLED,
+    timeout=Config.CACHE_WARMUP_TIMEOUT
+)
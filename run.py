@@ -19,7 +19,10 @@ os.environ.setdefault('FLASK_ENV', 'development')
 if __name__ == '__main__':
     from app import create_app
     
-    app = create_app()
+    # With debug=True the reloader runs this script twice: a watcher process and
+    # the child that serves requests (WERKZEUG_RUN_MAIN set). Only the child
+    # starts the warm-up and polling threads.
+    app = create_app(start_background=os.environ.get('WERKZEUG_RUN_MAIN') == 'true')
     print("🔵 Blue's Book - Starting Flask Application")
     print("=" * 50)
     print("🌐 Server: http://localhost:5001")
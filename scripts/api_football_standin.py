@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Blue's Book - Local API-Football Stand-in
+Replays recorded API-Football responses so FootballAPIService and DataLoader
+can be benchmarked and tested offline, with injectable latency, errors and 429s
+
+Point the backend at it with API_FOOTBALL_URL=http://127.0.0.1:8099/v3
+"""
+
+import sys
+import os
+import re
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from urllib.parse import urlsplit, parse_qsl, urlencode
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import requests
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'api_football_fixtures')
+UPSTREAM_URL = 'https://api-football-v1.p.rapidapi.com/v3'
+ENDPOINTS = [
+    'teams/statistics', 'fixtures', 'standings', 'players',
+    'players/squads', 'players/statistics', 'transfers', 'coachs'
+]
+# Params that select a different kind of response rather than filtering one
+# (fixtures__id.json answers fixtures?id=<any fixture>, e.g. the live match)
+SELECTOR_PARAMS = ['next', 'last', 'live', 'id']
+
+def fixture_names(endpoint, params):
+    """Fixture files to try for a request, most specific first"""
+    base = endpoint.replace('/', '_')
+    exact = re.sub(r'[^A-Za-z0-9=&._-]', '_', urlencode(sorted(params.items())))
+    names = [f"{base}__{exact}.json"] if exact else []
+    names += [f"{base}__{name}.json" for name in SELECTOR_PARAMS if name in params]
+    names.append(f"{base}.json")
+    return names
+
+class StandinState:
+    """Options and counters shared by the request handlers"""
+
+    def __init__(self, args):
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.lock = threading.Lock()
+        self.daily_used = 0
+        self.minute_started = time.time()
+        self.minute_used = 0
+        self.counters = {
+            'requests': 0, 'served': 0, 'not_modified': 0, 'recorded': 0,
+            'injected_errors': 0, 'injected_429s': 0, 'rate_limited': 0, 'missing': 0
+        }
+
+    def count(self, counter):
+        with self.lock:
+            self.counters[counter] += 1
+
+    def roll(self):
+        with self.lock:
+            return self.rng.random()
+
+    def latency(self):
+        """Injected delay in seconds"""
+        with self.lock:
+            jitter = self.rng.uniform(-self.args.jitter, self.args.jitter)
+        return max(0.0, self.args.latency + jitter) / 1000
+
+    def take_quota(self):
+        """Count a request against the simulated per-minute and daily limits"""
+        with self.lock:
+            if time.time() - self.minute_started >= 60:
+                self.minute_started = time.time()
+                self.minute_used = 0
+            within_limits = (
+                (not self.args.per_minute or self.minute_used < self.args.per_minute)
+                and self.daily_used < self.args.daily_quota
+            )
+            if within_limits:
+                self.minute_used += 1
+                self.daily_used += 1
+            return within_limits
+
+    def rate_limit_headers(self):
+        """RapidAPI daily quota and API-Football per-minute headers"""
+        with self.lock:
+            headers = {
+                'x-ratelimit-requests-limit': str(self.args.daily_quota),
+                'x-ratelimit-requests-remaining': str(max(0, self.args.daily_quota - self.daily_used)),
+                'x-ratelimit-requests-reset': str(int(86400 - time.time() % 86400))
+            }
+            if self.args.per_minute:
+                headers['X-RateLimit-Limit'] = str(self.args.per_minute)
+                headers['X-RateLimit-Remaining'] = str(max(0, self.args.per_minute - self.minute_used))
+        return headers
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """Serves /v3/<endpoint> from fixtures (or upstream when recording)"""
+
+    state = None
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        endpoint = url.path.strip('/')
+        if endpoint.startswith('v3/'):
+            endpoint = endpoint[3:]
+        params = dict(parse_qsl(url.query))
+
+        if endpoint == '__standin__/stats':
+            return self.send_json(200, {**self.state.counters, 'daily_used': self.state.daily_used})
+
+        self.state.count('requests')
+        time.sleep(self.state.latency())
+
+        if endpoint not in ENDPOINTS:
+            return self.send_json(404, {'message': f"Endpoint '{endpoint}' does not exist"})
+        if not self.headers.get('X-RapidAPI-Key'):
+            return self.send_json(401, {'message': 'Invalid API key. Go to https://docs.rapidapi.com/docs/keys for more info.'})
+
+        roll = self.state.roll()
+        if roll < self.state.args.rate_limit_rate:
+            self.state.count('injected_429s')
+            return self.send_json(429, {'message': 'Too many requests'}, self.state.rate_limit_headers())
+        if roll < self.state.args.rate_limit_rate + self.state.args.error_rate:
+            self.state.count('injected_errors')
+            return self.send_json(self.state.rng.choice([500, 502, 503]), {'message': 'Injected upstream error'})
+        if not self.state.take_quota():
+            self.state.count('rate_limited')
+            return self.send_json(429, {'message': 'You have exceeded the rate limit per minute for your plan'},
+                                  self.state.rate_limit_headers())
+
+        if self.state.args.record:
+            return self.record(endpoint, params)
+
+        body = self.load_fixture(endpoint, params)
+        if body is None:
+            self.state.count('missing')
+            return self.send_json(200, {'get': endpoint, 'parameters': params, 'errors': [], 'results': 0,
+                                        'paging': {'current': 1, 'total': 1}, 'response': []})
+        self.send_body(200, body, self.state.rate_limit_headers())
+
+    def load_fixture(self, endpoint, params):
+        """Recorded body for the request, with list responses cut to the next/last count"""
+        for name in fixture_names(endpoint, params):
+            path = os.path.join(self.state.args.fixtures, name)
+            if os.path.exists(path):
+                with open(path, 'rb') as fixture_file:
+                    body = fixture_file.read()
+                break
+        else:
+            return None
+
+        count = params.get('next') or params.get('last')
+        if count and count.isdigit():
+            payload = json.loads(body)
+            if isinstance(payload.get('response'), list):
+                payload['response'] = payload['response'][:int(count)]
+                payload['results'] = len(payload['response'])
+                payload['parameters'] = params
+                body = json.dumps(payload).encode()
+        return body
+
+    def record(self, endpoint, params):
+        """Forward to API-Football and save a successful response as a fixture"""
+        headers = {
+            'X-RapidAPI-Key': self.headers.get('X-RapidAPI-Key'),
+            'X-RapidAPI-Host': self.headers.get('X-RapidAPI-Host', 'api-football-v1.p.rapidapi.com')
+        }
+        try:
+            response = requests.get(f"{self.state.args.upstream}/{endpoint}", headers=headers, params=params, timeout=30)
+        except requests.exceptions.RequestException as e:
+            return self.send_json(502, {'message': f"Upstream request failed: {e}"})
+
+        if response.status_code == 200:
+            payload = response.json()
+            names = fixture_names(endpoint, params)
+            # Save under the exact params, and as the endpoint default if there is none yet
+            targets = [names[0]] + [name for name in names[1:] if not os.path.exists(os.path.join(self.state.args.fixtures, name))]
+            for name in targets:
+                with open(os.path.join(self.state.args.fixtures, name), 'w') as fixture_file:
+                    json.dump(payload, fixture_file, indent=2, ensure_ascii=False)
+                    fixture_file.write('\n')
+            self.state.count('recorded')
+            print(f"📼 Recorded {endpoint} {params} -> {', '.join(targets)}")
+
+        passthrough = {name: value for name, value in response.headers.items() if name.lower().startswith('x-ratelimit')}
+        self.send_body(response.status_code, response.content, passthrough)
+
+    def send_body(self, status, body, headers=None):
+        """Send a JSON body with an ETag, answering matching If-None-Match with 304"""
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        if status == 200 and self.headers.get('If-None-Match') == etag:
+            self.state.count('not_modified')
+            status, body = 304, b''
+        elif status == 200:
+            self.state.count('served')
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if status in (200, 304):
+            self.send_header('ETag', etag)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_json(self, status, payload, headers=None):
+        self.send_body(status, json.dumps(payload).encode(), headers)
+
+    def log_message(self, format, *args):
+        if not self.state.args.quiet:
+            super().log_message(format, *args)
+
+def main():
+    """Serve recorded API-Football responses until interrupted"""
+    parser = argparse.ArgumentParser(description='Local API-Football stand-in with record/replay')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on')
+    parser.add_argument('--port', type=int, default=8099, help='Port to listen on')
+    parser.add_argument('--fixtures', default=FIXTURES_DIR, help='Directory of recorded responses')
+    parser.add_argument('--latency', type=float, default=0, help='Added latency per request in ms')
+    parser.add_argument('--jitter', type=float, default=0, help='Random +/- variation of the latency in ms')
+    parser.add_argument('--error-rate', type=float, default=0, help='Fraction of requests answered with a 5xx')
+    parser.add_argument('--rate-limit-rate', type=float, default=0, help='Fraction of requests answered with a 429')
+    parser.add_argument('--per-minute', type=int, default=0, help='Requests per minute before real 429s (0 = unlimited)')
+    parser.add_argument('--daily-quota', type=int, default=100000, help='Simulated daily quota reported in headers')
+    parser.add_argument('--record', action='store_true', help='Forward requests upstream and save responses as fixtures')
+    parser.add_argument('--upstream', default=os.getenv('API_FOOTBALL_UPSTREAM_URL', UPSTREAM_URL), help='API-Football base URL used when recording')
+    parser.add_argument('--seed', type=int, default=None, help='Seed for reproducible error injection')
+    parser.add_argument('--quiet', action='store_true', help='Do not log each request')
+    args = parser.parse_args()
+
+    os.makedirs(args.fixtures, exist_ok=True)
+    StandinHandler.state = StandinState(args)
+    server = ThreadingHTTPServer((args.host, args.port), StandinHandler)
+
+    print("🔵 Blue's Book - API-Football Stand-in")
+    print("=" * 50)
+    print(f"🌐 Listening on http://{args.host}:{args.port}/v3 ({'recording from ' + args.upstream if args.record else 'replaying'})")
+    print(f"📁 Fixtures: {args.fixtures}")
+    print(f"⏱️  Latency {args.latency}±{args.jitter}ms, errors {args.error_rate:.0%}, 429s {args.rate_limit_rate:.0%}")
+    print(f"ℹ️  Set API_FOOTBALL_URL=http://{args.host}:{args.port}/v3 for the backend")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stand-in stopped")
+    finally:
+        server.server_close()
+
+    return True
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Blue's Book - Cache Concurrency Benchmark
+Measures CacheService throughput and consistency under concurrent access
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+import threading
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from services.cache_service import CacheService
+
+THREAD_COUNTS = [1, 4, 16, 64]
+
+def run_workload(cache, threads, duration, key_space, read_ratio):
+    """Hammer the cache from several threads and return total operations and errors"""
+    stop = threading.Event()
+    start = threading.Barrier(threads + 1)
+    operations = [0] * threads
+    errors = []
+
+    def worker(index):
+        rng = random.Random(index)
+        count = 0
+        start.wait()
+        try:
+            while not stop.is_set():
+                key = f"bench_key_{rng.randrange(key_space)}"
+                roll = rng.random()
+                if roll < read_ratio:
+                    cache.get(key)
+                elif roll < read_ratio + (1 - read_ratio) * 0.8:
+                    cache.set(key, {'value': count}, ttl=rng.choice([0.01, 60]))
+                elif roll < 0.999:
+                    cache.delete(key)
+                else:
+                    cache.cleanup_expired()
+                count += 1
+        except Exception as e:
+            errors.append(repr(e))
+        operations[index] = count
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+
+    start.wait()
+    time.sleep(duration)
+    stop.set()
+
+    for thread in workers:
+        thread.join()
+
+    return sum(operations), errors
+
+def check_consistency(cache):
+    """Byte and entry accounting must match what the shards actually hold"""
+    stats = cache.get_stats()
+    namespace_entries = sum(ns['entries'] for ns in stats['namespaces'].values())
+    return namespace_entries == stats['total_entries'] == len(cache)
+
+def main():
+    """Run the benchmark for each thread count and shard setting"""
+    parser = argparse.ArgumentParser(description='Benchmark CacheService under concurrent access')
+    parser.add_argument('--duration', type=float, default=2.0, help='Seconds per run')
+    parser.add_argument('--keys', type=int, default=10000, help='Number of distinct keys')
+    parser.add_argument('--read-ratio', type=float, default=0.9, help='Fraction of operations that are reads')
+    parser.add_argument('--max-entries', type=int, default=5000, help='Cache entry limit')
+    args = parser.parse_args()
+
+    print("🔵 Blue's Book - Cache Concurrency Benchmark")
+    print("=" * 60)
+    print(f"{'shards':>7} {'threads':>8} {'ops/sec':>14} {'errors':>8} {'consistent':>11}")
+
+    all_ok = True
+    for shards in (1, 16):
+        for threads in THREAD_COUNTS:
+            cache = CacheService(default_ttl=60, max_entries=args.max_entries, num_shards=shards)
+            total, errors = run_workload(cache, threads, args.duration, args.keys, args.read_ratio)
+            consistent = check_consistency(cache)
+            all_ok = all_ok and consistent and not errors
+            print(f"{shards:>7} {threads:>8} {total / args.duration:>14,.0f} {len(errors):>8} "
+                  f"{'yes' if consistent else 'NO':>11}")
+
+    print("=" * 60)
+    print("ℹ️  CPython's GIL caps raw throughput; sharding keeps lock contention")
+    print("   from dropping it as threads are added.")
+
+    return all_ok
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Blue's Book - Cache Backend Check Script
+Runs the CacheService contract against the in-memory and Redis backends
+"""
+
+import sys
+import os
+import time
+import shutil
+import socket
+import subprocess
+import threading
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from services.cache_service import CacheService, RedisCacheService, TieredCacheService
+
+def get_redis_client_factory():
+    """Return a factory for Redis clients sharing one fakeredis or spawned redis-server"""
+    try:
+        import fakeredis
+        print("ℹ️  Using fakeredis")
+        server = fakeredis.FakeServer()
+        return lambda: fakeredis.FakeRedis(server=server), None
+    except ImportError:
+        pass
+
+    server_binary = shutil.which('redis-server')
+    if not server_binary:
+        return None, None
+
+    import redis
+
+    # Pick a free local port for a throwaway server
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+
+    process = subprocess.Popen(
+        [server_binary, '--port', str(port), '--save', '', '--appendonly', 'no'],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    client = redis.Redis(port=port)
+
+    for _ in range(50):
+        try:
+            client.ping()
+            print(f"ℹ️  Using redis-server on port {port}")
+            return lambda: redis.Redis(port=port), process
+        except redis.exceptions.ConnectionError:
+            time.sleep(0.1)
+
+    process.terminate()
+    return None, None
+
+def check_get_set_delete(cache):
+    """Values round-trip and can be deleted"""
+    cache.set('chelsea_stats_2024', {'available': True, 'wins': 20})
+    assert cache.get('chelsea_stats_2024') == {'available': True, 'wins': 20}
+    assert cache.delete('chelsea_stats_2024') is True
+    assert cache.get('chelsea_stats_2024') is None
+    assert cache.delete('chelsea_stats_2024') is False
+
+def check_ttl(cache):
+    """Entries disappear after their TTL"""
+    cache.set('fixtures_next', [1, 2, 3], ttl=0.2)
+    assert cache.get('fixtures_next') == [1, 2, 3]
+    time.sleep(0.3)
+    assert cache.get('fixtures_next') is None
+
+def check_stale_window(cache):
+    """Stale values are served while a background refresh runs"""
+    calls = []
+
+    def loader():
+        calls.append(True)
+        return len(calls)
+
+    assert cache.get_or_compute('standings', loader, ttl=0.2, stale_ttl=5) == 1
+    time.sleep(0.3)
+    value, info = cache.get_or_compute_with_info('standings', loader, ttl=0.2, stale_ttl=5)
+    assert value == 1 and info['stale'] is True
+    time.sleep(0.05)
+    assert cache.get('standings') == 2
+
+def check_clear_and_stats(cache):
+    """Clearing empties the cache and stats report hits and misses"""
+    cache.set('squad_stats', {'players': 25})
+    cache.get('squad_stats')
+    cache.get('missing_key')
+    stats = cache.get_stats()
+    assert stats['hits'] >= 1 and stats['misses'] >= 1
+    cache.clear()
+    assert cache.get('squad_stats') is None
+
+def check_tag_invalidation(cache):
+    """Invalidating a tag drops every entry carrying it and nothing else"""
+    cache.set('standings', {'position': 4}, tags=['results', 'season:2024'])
+    cache.set('recent_matches', [1, 2], tags=['fixtures', 'results', 'season:2024'])
+    cache.set('next_matches', [3], tags=['fixtures', 'season:2024'])
+    cache.set('history', {'trophies': 21})
+
+    cache.invalidate_tag('results')
+    assert cache.get('standings') is None
+    assert cache.get('recent_matches') is None
+    assert cache.get('next_matches') == [3]
+    assert cache.get('history') == {'trophies': 21}
+
+    cache.set('standings', {'position': 3}, tags=['results', 'season:2024'])
+    assert cache.get('standings') == {'position': 3}
+    cache.invalidate_tag('season:2024')
+    assert cache.get('standings') is None and cache.get('next_matches') is None
+
+def check_invalidation_during_load(cache):
+    """A tag invalidated while a value is loading drops that value too"""
+    def loader():
+        time.sleep(0.3)
+        return {'position': 4}
+
+    def invalidate():
+        time.sleep(0.1)
+        cache.invalidate_tag('results')
+
+    invalidator = threading.Thread(target=invalidate)
+    invalidator.start()
+    assert cache.get_or_compute('standings', loader, ttl=60, tags=['results']) == {'position': 4}
+    invalidator.join()
+    assert cache.get('standings') is None
+
+def check_early_refresh(cache):
+    """Slow loaders are refreshed in the background before their entry expires"""
+    calls = []
+
+    def loader():
+        time.sleep(0.05)
+        calls.append(True)
+        return len(calls)
+
+    previous_beta = cache.early_refresh_beta
+    try:
+        # A huge beta makes the early refresh certain, keeping the check deterministic
+        cache.early_refresh_beta = 10 ** 6
+        assert cache.get_or_compute('chelsea_stats_2024', loader, ttl=1) == 1
+        value, info = cache.get_or_compute_with_info('chelsea_stats_2024', loader, ttl=1)
+        assert value == 1 and info['from_cache'] and not info['stale']
+        time.sleep(0.2)
+        assert cache.get('chelsea_stats_2024') == 2
+
+        cache.early_refresh_beta = 0
+        assert cache.get_or_compute('chelsea_stats_2024', loader, ttl=1) == 2
+        time.sleep(0.2)
+        assert len(calls) == 2
+    finally:
+        cache.early_refresh_beta = previous_beta
+
+def check_compression(cache):
+    """Large values are stored compressed and read back unchanged"""
+    standings = {'standings': [{'rank': rank, 'team': f"Team {rank}", 'points': 90 - rank} for rank in range(20)]}
+
+    previous_threshold = cache.compression_threshold
+    try:
+        cache.compression_threshold = 1024
+        cache.set('league_standings_39_2024', standings)
+        cache.set('small', {'position': 4})
+        assert cache.get('league_standings_39_2024') == standings
+        assert cache.get('small') == {'position': 4}
+        assert cache.get_stats()['compression']['ratio'] > 1
+    finally:
+        cache.compression_threshold = previous_threshold
+
+CHECKS = [
+    check_get_set_delete, check_ttl, check_stale_window, check_clear_and_stats,
+    check_tag_invalidation, check_invalidation_during_load, check_early_refresh, check_compression
+]
+
+def check_tiered_invalidation(make_client):
+    """A write, delete or tag invalidation on one worker evicts L1 copies on the others"""
+    worker_a = TieredCacheService(RedisCacheService(make_client(), prefix='bluesbook:check:'), l1_ttl=60)
+    worker_b = TieredCacheService(RedisCacheService(make_client(), prefix='bluesbook:check:'), l1_ttl=60)
+
+    worker_a.set('standings', {'position': 4})
+    assert worker_b.get('standings') == {'position': 4}
+    assert worker_a.get('standings') == {'position': 4}
+    # Give both invalidation listeners time to subscribe
+    time.sleep(0.3)
+
+    worker_b.set('standings', {'position': 3})
+    time.sleep(0.3)
+    assert worker_a.get('standings') == {'position': 3}
+
+    worker_b.delete('standings')
+    time.sleep(0.3)
+    assert worker_a.get('standings') is None
+
+    worker_a.set('standings', {'position': 2}, tags=['results'])
+    assert worker_a.get('standings') == {'position': 2}
+    worker_b.invalidate_tag('results')
+    time.sleep(0.3)
+    assert worker_a.get('standings') is None
+
+def run_checks(name, cache):
+    """Run every check against a backend, returning True if all pass"""
+    print(f"\n🔍 Testing {name} backend...")
+    passed = True
+
+    for check in CHECKS:
+        cache.clear()
+        try:
+            check(cache)
+            print(f"✅ {check.__doc__}")
+        except AssertionError:
+            print(f"❌ {check.__doc__}")
+            passed = False
+
+    return passed
+
+def main():
+    """Run cache backend checks"""
+    print("🔵 Blue's Book - Cache Backend Check")
+    print("=" * 50)
+
+    results = [run_checks('memory', CacheService(default_ttl=60))]
+
+    make_client, process = get_redis_client_factory()
+    if make_client is None:
+        print("\n⚠️  Skipping Redis backends: install fakeredis or redis-server")
+    else:
+        try:
+            redis_cache = RedisCacheService(make_client(), default_ttl=60, prefix='bluesbook:check:')
+            results.append(run_checks('redis', redis_cache))
+            results.append(run_checks('tiered', TieredCacheService(redis_cache)))
+
+            print("\n🔍 Testing tiered invalidation...")
+            try:
+                check_tiered_invalidation(make_client)
+                print(f"✅ {check_tiered_invalidation.__doc__}")
+                results.append(True)
+            except AssertionError:
+                print(f"❌ {check_tiered_invalidation.__doc__}")
+                results.append(False)
+        finally:
+            if process:
+                process.terminate()
+
+    print("\n" + "=" * 50)
+    print(f"📊 Check groups passed: {sum(results)}/{len(results)}")
+
+    return all(results)
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
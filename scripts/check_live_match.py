@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Blue's Book - Live Match Check Script
+Runs the live match tracker against the API-Football stand-in and checks
+deltas, sequence numbers and the /live-match ?since= filter
+"""
+
+import sys
+import os
+import time
+import socket
+import tempfile
+import subprocess
+
+import requests
+
+# Point the backend at a throwaway stand-in before its config loads
+with socket.socket() as sock:
+    sock.bind(('127.0.0.1', 0))
+    STANDIN_PORT = sock.getsockname()[1]
+
+os.environ['API_FOOTBALL_URL'] = f"http://127.0.0.1:{STANDIN_PORT}/v3"
+os.environ.setdefault('API_FOOTBALL_KEY', 'standin')
+os.environ['RAPIDAPI_QUOTA_STATE_PATH'] = os.path.join(tempfile.mkdtemp(), 'quota.json')
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from flask import Flask
+
+from routes.chat_routes import chat_bp
+from services.cache_service import api_football_cache
+from services.football_api_service import FootballAPIService, LIVE_MATCH_KEY, fixture_calendar
+from services.live_match_service import LiveMatchTracker, compute_deltas
+
+LIVE_FIXTURE_ID = 1379000  # scripts/api_football_fixtures/fixtures__id.json
+
+def start_standin():
+    """Start the stand-in on STANDIN_PORT and wait until it answers"""
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(os.path.dirname(__file__), 'api_football_standin.py'),
+         '--port', str(STANDIN_PORT), '--quiet'],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+    for _ in range(50):
+        try:
+            requests.get(f"http://127.0.0.1:{STANDIN_PORT}/v3/fixtures", params={'id': LIVE_FIXTURE_ID}, timeout=1)
+            return process
+        except requests.exceptions.ConnectionError:
+            time.sleep(0.1)
+
+    process.terminate()
+    return None
+
+def live_match_key():
+    return LIVE_MATCH_KEY.format(team_id=FootballAPIService().chelsea_team_id)
+
+def check_compute_deltas():
+    """compute_deltas reports status, score and only new events"""
+    first = {
+        'status': {'short': '1H', 'long': 'First Half'},
+        'score': '1-0',
+        'events': [{'minute': 23, 'team': 'Chelsea', 'player': 'Cole Palmer', 'type': 'Goal', 'detail': 'Normal Goal'}]
+    }
+    deltas = compute_deltas(None, first)
+    assert [delta['type'] for delta in deltas] == ['status', 'goal']
+    assert compute_deltas(first, first) == []
+
+    second = {
+        **first,
+        'score': '2-0',
+        'events': first['events'] * 2
+    }
+    deltas = compute_deltas(first, second)
+    assert [delta['type'] for delta in deltas] == ['score', 'goal']
+    assert deltas[0]['from'] == '1-0' and deltas[0]['to'] == '2-0'
+
+def check_first_poll(tracker):
+    """The first poll writes every event so far with sequence numbers 1..n"""
+    deltas = tracker.poll_once()
+    entry = api_football_cache.get(live_match_key())
+
+    assert entry is not None and entry['fixture_id'] == LIVE_FIXTURE_ID
+    assert entry['live'] is True and entry['score'] == '2-1'
+    assert deltas[0]['type'] == 'status' and deltas[0]['to'] == '2H'
+    assert [delta['seq'] for delta in deltas] == list(range(1, len(deltas) + 1))
+    assert entry['seq'] == len(deltas) == len(entry['events']) + 1
+    assert entry['deltas'] == deltas
+
+def check_unchanged_poll(tracker):
+    """Polling an unchanged fixture adds no deltas and keeps the sequence"""
+    seq = api_football_cache.get(live_match_key())['seq']
+    assert tracker.poll_once() == []
+    assert api_football_cache.get(live_match_key())['seq'] == seq
+
+def check_new_events(tracker):
+    """A new goal adds score and event deltas continuing the sequence"""
+    # Rewind the cached state to before the last goal, as if it was scored since the last poll
+    entry = api_football_cache.get(live_match_key())
+    api_football_cache.set(live_match_key(), {**entry, 'score': '1-1', 'events': entry['events'][:-1]})
+
+    deltas = tracker.poll_once()
+    assert [delta['type'] for delta in deltas] == ['score', 'goal']
+    assert deltas[1]['player'] == 'Nicolas Jackson'
+    assert [delta['seq'] for delta in deltas] == [entry['seq'] + 1, entry['seq'] + 2]
+    assert api_football_cache.get(live_match_key())['seq'] == entry['seq'] + 2
+
+def check_since_filter(tracker):
+    """GET /live-match?since=<seq> returns only later deltas"""
+    app = Flask(__name__)
+    app.register_blueprint(chat_bp, url_prefix='/api/v1/chat')
+    client = app.test_client()
+    seq = api_football_cache.get(live_match_key())['seq']
+
+    body = client.get('/api/v1/chat/live-match').get_json()
+    assert body['live'] is True and len(body['data']['deltas']) == seq
+
+    body = client.get(f'/api/v1/chat/live-match?since={seq - 2}').get_json()
+    assert [delta['seq'] for delta in body['data']['deltas']] == [seq - 1, seq]
+
+    body = client.get(f'/api/v1/chat/live-match?since={seq}').get_json()
+    assert body['data']['deltas'] == [] and body['data']['score'] == '2-1'
+
+CHECKS = [check_first_poll, check_unchanged_poll, check_new_events, check_since_filter]
+
+def main():
+    """Run live match checks"""
+    print("🔵 Blue's Book - Live Match Check")
+    print("=" * 50)
+
+    results = []
+    print("\n🔍 Testing deltas...")
+    try:
+        check_compute_deltas()
+        print(f"✅ {check_compute_deltas.__doc__}")
+        results.append(True)
+    except AssertionError:
+        print(f"❌ {check_compute_deltas.__doc__}")
+        results.append(False)
+
+    process = start_standin()
+    if process is None:
+        print("\n⚠️  Skipping tracker checks: the stand-in did not start")
+    else:
+        try:
+            print(f"\n🔍 Testing tracker against the stand-in on port {STANDIN_PORT}...")
+            # Kicked off ten minutes ago
+            fixture_calendar.add_fixtures([(time.time() - 600, LIVE_FIXTURE_ID)])
+            tracker = LiveMatchTracker(interval=0)
+            api_football_cache.delete(live_match_key())
+
+            for check in CHECKS:
+                try:
+                    check(tracker)
+                    print(f"✅ {check.__doc__}")
+                    results.append(True)
+                except AssertionError:
+                    print(f"❌ {check.__doc__}")
+                    results.append(False)
+        finally:
+            process.terminate()
+
+    print("\n" + "=" * 50)
+    print(f"📊 Checks passed: {sum(results)}/{len(results)}")
+
+    return all(results)
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)